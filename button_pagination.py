@@ -13,5 +13,5 @@ schema: BrowserCrawlerSchema = {
 }
 
 url = "https://web-scraping.dev/reviews"
-data = crawler.fetch(url, schema=schema, wait_until="networkidle")
+data = crawler.fetch(url, schema=schema)
 print(data)
\ No newline at end of file
@@ -1,9 +1,402 @@
-import time
-from typing import List, Dict, Any
+import atexit
+import asyncio
+import inspect
+import pickle
+import re
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+import aiohttp
+import requests
+from typing import List, Dict, Any, Iterator, Literal, Optional, Tuple, Union
+from crawl2schema.crawler.cache import ResultCache, request_key
+from crawl2schema.crawler.concurrency import AdaptiveLimiter, ConcurrencySettings
+from crawl2schema.crawler.compiler import CASTERS, CompiledField, compile_fields, css_first_memo, follow_targets, merge_follows, page_urls, prefetch_first_matches, record_template, records_to_columns
+from crawl2schema.crawler.http import aiohttp_markup, pooled_session, response_markup
 from crawl2schema.crawler.schema import SyncBrowserCrawlerSchema, AsyncBrowserCrawlerSchema, URLPaginationSchema
 from crawl2schema.exceptions import RequestError, CrawlerError, FormatterError, ParseError
-from selectolax.parser import HTMLParser
-from playwright.sync_api import sync_playwright, BrowserContext
+try:
+    from selectolax.lexbor import LexborHTMLParser as HTMLParser
+except ImportError:  # selectolax builds without the Lexbor backend
+    from selectolax.parser import HTMLParser
+from playwright.sync_api import sync_playwright, Playwright, Browser, BrowserContext, Locator, Page, Error as PlaywrightError, TimeoutError as PlaywrightTimeoutError
+from playwright.async_api import async_playwright, BrowserContext as AsyncBrowserContext, Locator as AsyncLocator, Page as AsyncPage
+
+
+def _http_fast_path_allowed(schema) -> bool:
+    """
+    The HTTP fast path only applies to schemas that opt in with `prefer_http` and
+    don't depend on the live page (scrolling, clicking, waiting or page callbacks).
+    """
+    return bool(
+        schema.get("prefer_http")
+        and schema.get("base_selector")
+        and not schema.get("scroll_pagination")
+        and not schema.get("button_pagination")
+        and not schema.get("wait_for_selector")
+        and not schema.get("on_pageload")
+    )
+
+
+# Reads every field of every base element in a single round trip. Values come back
+# raw (textContent or attribute); formatters and casting still run in Python.
+# Scalar fields yield null when the element is missing and [value] otherwise,
+# where value is null if the requested attribute is absent. Like selectolax's
+# css()/css_first(), `first` and `all` include the scoping element itself.
+_EXTRACT_JS = """
+([baseSelector, fields]) => {
+    const read = (el, attribute) => attribute ? el.getAttribute(attribute) : el.textContent;
+    const first = (parent, selector) => parent.matches(selector) ? parent : parent.querySelector(selector);
+    const all = (parent, selector) => {
+        const found = Array.from(parent.querySelectorAll(selector));
+        return parent.matches(selector) ? [parent, ...found] : found;
+    };
+    const extract = (parent, field) => {
+        if (field.subfields) {
+            return all(parent, field.selector).map((el) =>
+                field.subfields.map((sub) => {
+                    const subEl = first(el, sub.selector);
+                    return subEl ? read(subEl, sub.attribute) : null;
+                }));
+        }
+        if (field.list) {
+            return all(parent, field.selector).map((el) => read(el, field.attribute));
+        }
+        const el = field.selector ? first(parent, field.selector) : null;
+        return el ? [read(el, field.attribute)] : null;
+    };
+    return Array.from(document.querySelectorAll(baseSelector), (item) => fields.map((field) => extract(item, field)));
+}
+"""
+
+
+# goto() waits for DOMContentLoaded by default, then for base_selector itself,
+# instead of "load"/"networkidle" which analytics-heavy pages may never reach.
+_DEFAULT_WAIT_UNTIL = "domcontentloaded"
+# Default for the base_selector wait when neither the schema nor goto() sets a timeout
+_BASE_SELECTOR_TIMEOUT = 15000
+
+
+# Scroll the window, or the element a scroll_selector locator resolves to, by (dx, dy).
+# Constant functions for every scroll instead of freshly formatted snippets; elements
+# go through page.locator() so any Playwright selector (xpath=, text=, >>) works.
+_SCROLL_WINDOW_JS = "([dx, dy]) => window.scrollBy(dx, dy)"
+_SCROLL_ELEMENT_JS = "(el, [dx, dy]) => el.scrollBy(dx, dy)"
+
+
+# Threads used by SyncBrowserCrawler to download prefer_http follow targets in parallel
+_FOLLOW_HTTP_WORKERS = 8
+
+
+# outerHTML of every `sel` match from index `from` on, each wrapped in empty
+# copies of its ancestors so child/descendant selectors (and table rows) still
+# match when the fragments are parsed on their own.
+_ITEMS_SINCE_JS = """([sel, from]) => Array.from(document.querySelectorAll(sel)).slice(from).map((el) => {
+    let html = el.outerHTML;
+    for (let p = el.parentElement; p && p !== document.body && p !== document.documentElement; p = p.parentElement) {
+        const shell = p.cloneNode(false).outerHTML;
+        const close = shell.lastIndexOf("</");
+        html = shell.slice(0, close) + html + shell.slice(close);
+    }
+    return html;
+})"""
+# base_selectors that depend on an item's position, siblings or its ancestors' other
+# children, which the fragments above don't keep. These are matched on the whole page.
+_POSITIONAL_SELECTOR_RE = re.compile(r"[+~]|:(?:nth-|first-|last-|only-|has\()")
+
+
+# Resource types aborted when a schema sets `block_resources`
+_BLOCKED_RESOURCE_TYPES = frozenset({"image", "font", "media", "stylesheet"})
+
+
+def _route_blocking_resources(route) -> None:
+    if route.request.resource_type in _BLOCKED_RESOURCE_TYPES:
+        route.abort()
+    else:
+        route.continue_()
+
+
+async def _route_blocking_resources_async(route) -> None:
+    if route.request.resource_type in _BLOCKED_RESOURCE_TYPES:
+        await route.abort()
+    else:
+        await route.continue_()
+
+
+def _base_selector_wait_args(schema, goto_kwargs: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    wait_for_selector() options for the default wait on `base_selector`: goto()'s
+    `timeout` (else _BASE_SELECTOR_TIMEOUT), overridden by a selector-less
+    `wait_for_selector` in the schema.
+    """
+    options = {"timeout": goto_kwargs.get("timeout", _BASE_SELECTOR_TIMEOUT)}
+    options.update(schema.get("wait_for_selector") or {})
+    return options
+
+
+def _in_browser_extractable(schema, fields: Tuple[CompiledField, ...]) -> bool:
+    """
+    Whether fields can be read in the page with _EXTRACT_JS instead of serializing the DOM
+    for selectolax. Opt-in with `extract_in_browser: True`; nested `url_follow_schema`
+    fields always take the selectolax path.
+    """
+    return schema.get("extract_in_browser", False) and not _has_follows(fields)
+
+
+def _has_follows(fields: Tuple[CompiledField, ...]) -> bool:
+    for field in fields:
+        if field.url_follow_schema:
+            return True
+        if field.list_subfields and any(sub.url_follow_schema for sub in field.list_subfields):
+            return True
+    return False
+
+
+def _browser_field_spec(fields: Tuple[CompiledField, ...]) -> List[Dict[str, Any]]:
+    return [
+        {
+            "selector": field.selector,
+            "attribute": field.attribute,
+            "list": field.type_ == "list",
+            "subfields": [
+                {"selector": sub.selector, "attribute": sub.attribute} for sub in field.list_subfields
+            ] if field.type_ == "list" and field.list_subfields else None,
+        }
+        for field in fields
+    ]
+
+
+def _cast(value, type_: str):
+    try:
+        return CASTERS.get(type_, str)(value)
+    except Exception as e:
+        raise FormatterError(f"Failed to cast '{value}' to {type_}: {e}") from e
+
+
+def _records_from_browser_rows(rows: List[list], fields: Tuple[CompiledField, ...]) -> List[Dict[str, Any]]:
+    """Apply defaults, formatters and casting to the raw rows returned by _EXTRACT_JS."""
+    results = []
+    template = record_template(fields)
+    for row in rows:
+        record: Dict[str, Any] = template.copy()
+        for field, raw in zip(fields, row):
+            try:
+                # List fields are the ones compiled without an extract closure
+                if field.extract is None:
+                    values: List[Any] = []
+                    for entry in raw:
+                        if field.list_subfields:
+                            obj: Dict[str, Any] = field.subfield_template.copy()
+                            for sub, subraw in zip(field.list_subfields, entry):
+                                if subraw is None:
+                                    subraw = sub.default
+                                if sub.preformatter is not None:
+                                    subraw = sub.preformatter(subraw)
+                                subval = _cast(subraw, sub.type_)
+                                if sub.postformatter is not None:
+                                    subval = sub.postformatter(subval)
+                                obj[sub.name] = subval
+                            values.append(obj)
+                        else:
+                            if entry is None:
+                                entry = field.default
+                            if field.preformatter:
+                                entry = field.preformatter(entry)
+                            val = _cast(entry, field.type_)
+                            if field.postformatter:
+                                val = field.postformatter(val)
+                            values.append(val)
+                    if field.list_formatter is not None:
+                        values = field.list_formatter(values)
+                    record[field.name] = values
+                    continue
+
+                if raw is None:
+                    record[field.name] = field.default
+                    continue
+
+                value = field.default if raw[0] is None else raw[0]
+                if field.preformatter is not None:
+                    value = field.preformatter(value)
+                value = _cast(value, field.type_)
+                if field.postformatter is not None:
+                    value = field.postformatter(value)
+                record[field.name] = value
+            except FormatterError:
+                raise
+            except Exception as e:
+                raise CrawlerError(f"Failed to extract field {field.name}: {e}")
+        results.append(record)
+    return results
+
+
+def _extract_list_field(parent, field: CompiledField, pending: List[tuple]) -> Any:
+    """Extract a `list` field under `parent`. Subfield url-follows are appended to `pending`."""
+    values: List[Any] = []
+    list_subfields = field.list_subfields
+    subfield_template = field.subfield_template
+    attr = field.attribute
+    default = field.default
+    type_ = field.type_
+    preformatter = field.preformatter
+    postformatter = field.postformatter
+    list_formatter = field.list_formatter
+
+    for el in parent.css(field.selector):
+        if list_subfields:
+            obj: Dict[str, Any] = subfield_template.copy() if subfield_template is not None else {}
+            # Subfields sharing a selector (e.g. a link's text and href) share one lookup
+            memo: Dict[str, Any] = {}
+            # From the object's first follow on, its subfields are kept in order for merge_follows
+            steps: Optional[List[tuple]] = None
+            for sub in list_subfields:
+                sub_el = css_first_memo(el, sub.selector, memo)
+                subraw = sub.default
+                if sub_el:
+                    subraw = sub_el.attributes.get(sub.attribute, subraw) if sub.attribute else sub_el.text()
+
+                # Apply subfield formatters
+                if sub.preformatter is not None:
+                    subraw = sub.preformatter(subraw)
+                subval = _cast(subraw, sub.type_)
+                if sub.postformatter is not None:
+                    subval = sub.postformatter(subval)
+
+                # Nested URL-following inside lists
+                if sub.url_follow_schema and isinstance(subval, str):
+                    if steps is None:
+                        steps = [(name, v, None) for name, v in obj.items()]
+                        pending.append((obj, steps))
+                    steps.append((sub.name, subval, sub.url_follow_schema))
+                elif steps is None:
+                    obj[sub.name] = subval
+                else:
+                    steps.append((sub.name, subval, None))
+            values.append(obj)
+        else:
+            raw = el.attributes.get(attr, default) if attr else el.text()
+            if preformatter:
+                raw = preformatter(raw)
+            val = _cast(raw, type_)
+            if postformatter:
+                val = postformatter(val)
+            values.append(val)
+
+    if list_formatter is not None:
+        values = list_formatter(values)
+
+    return values
+
+
+def _extract_rows(tree, base_selector: str, fields: Tuple[CompiledField, ...], pending: List[tuple], start: int = 0) -> List[Dict[str, Any]]:
+    """
+    Extract one record per `base_selector` match in `tree`, from match `start` on.
+    url_follow_schema targets aren't fetched here; the records with follows are
+    appended to `pending` instead, as (record, steps) for `merge_follows`.
+    """
+    items = tree.css(base_selector)
+    if start:
+        items = items[start:]
+    memos = prefetch_first_matches(tree, base_selector, items, fields)
+    template = record_template(fields)
+    results = []
+
+    for i, item in enumerate(items):
+        record: Dict[str, Any] = template.copy() if template is not None else {}
+        found: Dict[str, Any] = memos[i] if memos else {}
+        # From the record's first follow on, its fields are kept in order as (name, value, follow schema)
+        steps: Optional[List[tuple]] = None
+        # One try per row; `field` still names the failing field in the handler
+        try:
+            for field in fields:
+                if field.extract is None:
+                    value = _extract_list_field(item, field, pending)
+                else:
+                    value = field.extract(item, found)
+
+                    # Nested URL-following is deferred until every row is extracted
+                    if field.url_follow_schema and isinstance(value, str):
+                        if steps is None:
+                            steps = [(name, v, None) for name, v in record.items()]
+                            pending.append((record, steps))
+                        steps.append((field.name, value, field.url_follow_schema))
+                        continue
+
+                if steps is None:
+                    record[field.name] = value
+                else:
+                    steps.append((field.name, value, None))
+        except CrawlerError:
+            raise
+        except Exception as e:
+            raise CrawlerError(f"Failed to extract field {field.name}: {e}") from e
+
+        results.append(record)
+
+    return results
+
+
+def _extract_html(html: str, schema: AsyncBrowserCrawlerSchema) -> List[Dict[str, Any]]:
+    """Parse and extract a schema without url-follows. Runs inside AsyncBrowserCrawler's parse workers."""
+    fields = compile_fields(schema.get("fields", []))
+    return _extract_rows(HTMLParser(html), schema["base_selector"], fields, [])
+
+
+class _BrowserPool:
+    """
+    Per-thread pool that keeps one Playwright driver and one Chromium browser
+    per headless mode warm, so crawler instances only pay for a fresh context
+    instead of a browser cold start. Per thread, since sync Playwright objects
+    only work on the thread that started their driver.
+    """
+
+    _local = threading.local()
+
+    def __init__(self) -> None:
+        self.playwright: Playwright = sync_playwright().start()
+        self._browsers: Dict[bool, Browser] = {}
+        # Contexts handed out and not yet released
+        self._leases = 0
+
+    @classmethod
+    def get(cls) -> "_BrowserPool":
+        """The calling thread's pool, started on first use."""
+        pool = getattr(cls._local, "pool", None)
+        if pool is None:
+            pool = cls._local.pool = cls()
+            # atexit handlers run on the main thread, so only its pool can be shut down there
+            if threading.current_thread() is threading.main_thread():
+                atexit.register(cls.shutdown)
+        return pool
+
+    def acquire(self, headless: bool = True) -> BrowserContext:
+        browser = self._browsers.get(headless)
+        if browser is None or not browser.is_connected():
+            browser = self.playwright.chromium.launch(headless=headless)
+            self._browsers[headless] = browser
+        # A new context per crawler, so no storage, permissions or routes carry over between them
+        context = browser.new_context()
+        self._leases += 1
+        return context
+
+    def release(self, context: BrowserContext, headless: bool = True) -> None:
+        context.close()
+        self._leases -= 1
+        # Only the main thread has an atexit hook, other threads stop with their last context
+        if self._leases <= 0 and threading.current_thread() is not threading.main_thread():
+            self.shutdown()
+
+    @classmethod
+    def shutdown(cls) -> None:
+        """Close the calling thread's browsers and stop its Playwright driver."""
+        pool = getattr(cls._local, "pool", None)
+        if pool is None:
+            return
+        cls._local.pool = None
+
+        for browser in pool._browsers.values():
+            if browser.is_connected():
+                browser.close()
+        pool.playwright.stop()
 
 
 class SyncBrowserCrawler:
@@ -13,32 +406,74 @@ class SyncBrowserCrawler:
     nested schemas, list subfields, and full field extraction with formatters.
     """
 
-    def __init__(self, context: BrowserContext = None):
-        if context is None:
-            self.playwright = sync_playwright().start()
-            browser = self.playwright.chromium.launch(headless=True)
-            self.context = browser.new_context()
+    def __init__(
+        self,
+        context: BrowserContext = None,
+        headless: bool = True,
+        cache_size: int = 0,
+        cache_ttl: Optional[float] = None
+    ):
+        self.headless = headless
+        self._pooled = context is None
+        if self._pooled:
+            # Kept, so the context goes back to the pool of the thread it came from
+            self._pool = _BrowserPool.get()
+            self.context = self._pool.acquire(headless)
         else:
             self.context = context
         self.page = self.context.new_page()
+        self._http_session: Optional[requests.Session] = None
+        # Warm pages reused for url_follow_schema fetches
+        self._page_pool: List[Page] = []
+        self._page_pool_size = 8
+        # Pages that currently have the block_resources route installed
+        self._blocking_pages: set = set()
+        # Records of the last `cache_size` (url, schema) fetches, optionally expiring after `cache_ttl` seconds
+        self._cache = ResultCache(cache_size, cache_ttl) if cache_size > 0 else None
+        # (url, id(follow schema)) -> tree downloaded ahead of time by _resolve_follows
+        self._prefetched: Dict[Tuple[str, int], Optional[HTMLParser]] = {}
 
-    def fetch(self, url: str, schema: SyncBrowserCrawlerSchema, *args, **kwargs) -> List[Dict[str, Any]]:
-        on_pageload = schema.get("on_pageload")
+    def fetch(
+        self,
+        url: str,
+        schema: SyncBrowserCrawlerSchema,
+        *args,
+        cache: bool = True,
+        layout: Literal["rows", "columns"] = "rows",
+        **kwargs
+    ) -> Union[List[Dict[str, Any]], Dict[str, List[Any]]]:
+        """
+        Fetch `url` with `schema`. Pass `cache=False` to bypass the result cache for this URL (nested follows still use it).
+        `layout="columns"` returns one list per field (see `records_to_columns`) instead of one dict per record.
+        """
+        result_cache = self._cache if cache else None
+        request = request_key(args, kwargs) if result_cache is not None else None
+        records = result_cache.get(url, schema, request) if result_cache is not None else None
+        if records is None:
+            records = self._fetch(url, schema, *args, **kwargs)
+            if result_cache is not None:
+                result_cache.put(url, schema, records, request)
+        return records_to_columns(records) if layout == "columns" else records
+
+    def clear_cache(self) -> None:
+        """Drop all cached results."""
+        if self._cache is not None:
+            self._cache.clear()
+
+    def _fetch(self, url: str, schema: SyncBrowserCrawlerSchema, *args, **kwargs) -> List[Dict[str, Any]]:
+        kwargs.setdefault("wait_until", _DEFAULT_WAIT_UNTIL)
+        self._set_resource_blocking(self.page, bool(schema.get("block_resources")))
         # URL Pagination
         if "url_pagination" in schema and schema["url_pagination"]:
             return self._handle_url_pagination(url, schema=schema, *args, **kwargs)
 
-        try:            
-            # Single-page extraction
-            self.page.goto(url, *args, **kwargs)
-            if on_pageload and callable(on_pageload):
-                on_pageload(self.page)
+        key = (url, id(schema))
+        tree = self._prefetched.pop(key) if key in self._prefetched else self._fetch_http(url, schema)
+        if tree is not None:
+            return self._extract_data(schema, tree)
 
-            wait_for_selector = schema.get("wait_for_selector")
-            if wait_for_selector:
-                self.page.wait_for_selector(**wait_for_selector)
-        except Exception as e:
-            raise RequestError(f"Failed to crawl {url}: {e}")
+        # Single-page extraction
+        self._goto(url, schema, *args, **kwargs)
 
         # Scroll Pagination
         if "scroll_pagination" in schema and schema["scroll_pagination"]:
@@ -49,10 +484,60 @@ class SyncBrowserCrawler:
         return self._extract_data(schema)
 
 
+    def fetch_incremental(self, url: str, schema: SyncBrowserCrawlerSchema, *args, **kwargs) -> Iterator[Dict[str, Any]]:
+        """
+        Like `fetch`, but yields records while scroll-paginating instead of after the last scroll.
+        Each step serializes only the items added since the previous step, not the whole page, unless
+        `base_selector` depends on the items' positions or siblings (`:nth-child`, `+`, `~`...).
+        Schemas without `scroll_pagination` are fetched normally and their records yielded.
+        """
+        if not schema.get("scroll_pagination") or schema.get("url_pagination"):
+            yield from self.fetch(url, schema, *args, **kwargs)
+            return
+
+        kwargs.setdefault("wait_until", _DEFAULT_WAIT_UNTIL)
+        self._set_resource_blocking(self.page, bool(schema.get("block_resources")))
+        self._goto(url, schema, *args, **kwargs)
+
+        records, emitted = self._extract_new_items(schema, 0)
+        yield from records
+        for count in self._scroll_steps(schema):
+            if count > emitted:
+                records, added = self._extract_new_items(schema, emitted)
+                emitted += added
+                yield from records
+
+    def _goto(self, url: str, schema: SyncBrowserCrawlerSchema, *args, **kwargs):
+        on_pageload = schema.get("on_pageload")
+        try:
+            self.page.goto(url, *args, **kwargs)
+            if on_pageload and callable(on_pageload):
+                on_pageload(self.page)
+
+            self._wait_until_ready(schema, kwargs)
+        except Exception as e:
+            raise RequestError(f"Failed to crawl {url}: {e}")
+
+    def _extract_new_items(self, schema: SyncBrowserCrawlerSchema, since: int) -> Tuple[List[Dict[str, Any]], int]:
+        """Extract the `base_selector` matches from index `since` on. Returns (records, items serialized)."""
+        if _POSITIONAL_SELECTOR_RE.search(schema["base_selector"]):
+            # The fragments would lose the items' positions and siblings; read the whole page
+            records = self._extract_data(schema, HTMLParser(self.page.content()), since)
+            return records, len(records)
+        fragments = self.page.evaluate(_ITEMS_SINCE_JS, [schema["base_selector"], since])
+        if not fragments:
+            return [], 0
+        return self._extract_data(schema, HTMLParser("".join(fragments))), len(fragments)
+
     # ---------------------------
     # Scroll Pagination
     # ---------------------------
     def _handle_scroll_pagination(self, schema: SyncBrowserCrawlerSchema):
+        for _ in self._scroll_steps(schema):
+            pass
+
+    def _scroll_steps(self, schema: SyncBrowserCrawlerSchema) -> Iterator[int]:
+        """Run the scroll pagination loop, yielding the `base_selector` count after every scroll."""
         pagination = schema["scroll_pagination"]
         stop_condition = pagination.get("stop_condition", "count")
         scroll_delay = pagination.get("scroll_delay", 1.5)
@@ -67,29 +552,20 @@ class SyncBrowserCrawler:
         total_scrolls = 0
         previous_count = 0
         retry_counter = 0
+        current_count = self.page.locator(base_selector).count()
 
         while True:
             # Scroll
-            if scroll_selector == "window":
-                if scroll_horizontal:
-                    self.page.evaluate(f"window.scrollBy({scroll_distance}, 0)")
-                else:
-                    self.page.evaluate(f"window.scrollBy(0, {scroll_distance})")
-            else:
-                if scroll_horizontal:
-                    self.page.locator(scroll_selector).evaluate(f"(el) => el.scrollBy({scroll_distance}, 0)")
-                else:
-                    self.page.locator(scroll_selector).evaluate(f"(el) => el.scrollBy(0, {scroll_distance})")
+            self._scroll_by(scroll_selector, scroll_distance, scroll_horizontal)
             
             if on_scroll and callable(on_scroll):
                 on_scroll(self.page)
             
-            time.sleep(scroll_delay)
+            self._wait_for_more_items(base_selector, current_count, scroll_delay)
             total_scrolls += 1
 
-            html = self.page.content()
-            tree = HTMLParser(html)
-            current_count = len(tree.css(base_selector))
+            current_count = self.page.locator(base_selector).count()
+            yield current_count
 
             if stop_condition == "count":
                 max_scrolls = pagination.get("scroll_count", 5)
@@ -105,26 +581,39 @@ class SyncBrowserCrawler:
                 if current_count == previous_count:
                     retry_counter += 1
                     if retry_scroll_distance != 0:
-                        if scroll_selector == "window":
-                            if scroll_horizontal:
-                                self.page.evaluate(f"window.scrollBy({retry_scroll_distance}, 0)")
-                            else:
-                                self.page.evaluate(f"window.scrollBy(0, {retry_scroll_distance})")
-                        else:
-                            if scroll_horizontal:
-                                self.page.locator(scroll_selector).evaluate(
-                                    f"(el) => el.scrollBy({retry_scroll_distance}, 0)"
-                                )
-                            else:
-                                self.page.locator(scroll_selector).evaluate(
-                                    f"(el) => el.scrollBy(0, {retry_scroll_distance})"
-                                )
+                        self._scroll_by(scroll_selector, retry_scroll_distance, scroll_horizontal)
                     if retry_counter >= retry_limit:
                         break
                 else:
                     retry_counter = 0
                     previous_count = current_count
 
+    def _scroll_by(self, scroll_selector: str, distance: int, horizontal: bool):
+        dx, dy = (distance, 0) if horizontal else (0, distance)
+        if scroll_selector == "window":
+            self.page.evaluate(_SCROLL_WINDOW_JS, [dx, dy])
+        else:
+            self.page.locator(scroll_selector).evaluate(_SCROLL_ELEMENT_JS, [dx, dy])
+
+    def _wait_for_more_items(self, base_selector: str, known_count: int, max_wait: float):
+        """Return once more than `known_count` items match `base_selector`, or after `max_wait` seconds."""
+        if max_wait <= 0:
+            return
+        try:
+            # Same locator as the counts, so items inside open shadow roots are seen by both
+            self.page.locator(base_selector).nth(known_count).wait_for(state="attached", timeout=max_wait * 1000)
+        except PlaywrightTimeoutError:
+            pass
+
+    def _wait_for_visible(self, locator: Locator, max_wait: float):
+        """Return once `locator` has a visible match, or after `max_wait` seconds."""
+        if max_wait <= 0:
+            return
+        try:
+            locator.first.wait_for(state="visible", timeout=max_wait * 1000)
+        except PlaywrightTimeoutError:
+            pass
+
     # ---------------------------
     # URL Pagination
     # ---------------------------
@@ -135,27 +624,67 @@ class SyncBrowserCrawler:
         start = pagination.get("start_page", 1)
         end = pagination.get("end_page", 1)
         placeholder = pagination.get("page_placeholder", "{page}")
-        wait_for_selector = schema.get("wait_for_selector")
+        urls = page_urls(url, placeholder, start, end)
+
         on_pageload = schema.get("on_pageload")
-        
-        for i in range(start, end + 1):
-            page_url = url.replace(placeholder, str(i))
+
+        for page_url in urls:
+            tree = self._fetch_http(page_url, schema)
+            if tree is not None:
+                results.extend(self._extract_data(schema, tree))
+                continue
 
             self.page.goto(page_url, *args, **kwargs)
-            
+
             if on_pageload and callable(on_pageload):
                 on_pageload(self.page)
 
-                
-            
-            if wait_for_selector:
-                self.page.wait_for_selector(**wait_for_selector)
-            
-            time.sleep(1.5) # TODO check if this breaks stuff on removal
+            self._wait_until_ready(schema, kwargs)
             results.extend(self._extract_data(schema))
 
         return results
 
+    def _wait_until_ready(self, schema: SyncBrowserCrawlerSchema, goto_kwargs: Dict[str, Any]):
+        """
+        Wait for the schema's `wait_for_selector`, or for `base_selector` when it names no selector.
+        A page that never shows `base_selector` is treated as having no items.
+        """
+        wait_for_selector = schema.get("wait_for_selector")
+        if wait_for_selector and wait_for_selector.get("selector"):
+            self.page.wait_for_selector(**wait_for_selector)
+        elif schema.get("base_selector"):
+            try:
+                self.page.wait_for_selector(schema["base_selector"], **_base_selector_wait_args(schema, goto_kwargs))
+            except PlaywrightTimeoutError:
+                pass
+
+    # ---------------------------
+    # HTTP Fast Path
+    # ---------------------------
+    def _get_http_session(self) -> requests.Session:
+        """The `prefer_http` session, created on first use. Not thread-safe; create it before fanning out."""
+        if self._http_session is None:
+            self._http_session = pooled_session()
+        return self._http_session
+
+    def _fetch_http(self, url: str, schema: SyncBrowserCrawlerSchema) -> Optional[HTMLParser]:
+        """
+        Fetch `url` with a plain HTTP request when the schema opts in via `prefer_http`.
+        Returns the parsed tree if the raw HTML already contains `base_selector` matches,
+        otherwise None so the caller falls back to rendering the page in the browser.
+        """
+        if not _http_fast_path_allowed(schema):
+            return None
+
+        try:
+            response = self._get_http_session().get(url, timeout=10)
+            response.raise_for_status()
+            tree = HTMLParser(response_markup(response))
+        except Exception:
+            return None
+
+        return tree if tree.css_first(schema["base_selector"]) else None
+
     # ---------------------------
     # Button Pagination
     # ---------------------------
@@ -188,21 +717,13 @@ class SyncBrowserCrawler:
         while True:
             # Scroll first if scroll_distance != 0
             if scroll_distance != 0:
-                if scroll_selector == "window":
-                    if scroll_horizontal:
-                        self.page.evaluate(f"window.scrollBy({scroll_distance}, 0)")
-                    else:
-                        self.page.evaluate(f"window.scrollBy(0, {scroll_distance})")
-                else:
-                    if scroll_horizontal:
-                        self.page.locator(scroll_selector).evaluate(f"(el) => el.scrollBy({scroll_distance}, 0)")
-                    else:
-                        self.page.locator(scroll_selector).evaluate(f"(el) => el.scrollBy(0, {scroll_distance})")
+                known_count = self.page.locator(base_selector).count()
+                self._scroll_by(scroll_selector, scroll_distance, scroll_horizontal)
                 
                 if on_scroll and callable(on_scroll):
                     on_scroll(self.page)
                 
-                time.sleep(cycle_delay)
+                self._wait_for_more_items(base_selector, known_count, cycle_delay)
                 total_scrolls += 1
 
             # Button check
@@ -212,23 +733,9 @@ class SyncBrowserCrawler:
                 if retry_counter < retry_limit:
                     retry_counter += 1
                     if retry_scroll_distance != 0:
-                        if scroll_selector == "window":
-                            if scroll_horizontal:
-                                self.page.evaluate(f"window.scrollBy({retry_scroll_distance}, 0)")
-                            else:
-                                self.page.evaluate(f"window.scrollBy(0, {retry_scroll_distance})")
-                        else:
-                            if scroll_horizontal:
-                                self.page.locator(scroll_selector).evaluate(
-                                    f"(el) => el.scrollBy({retry_scroll_distance}, 0)"
-                                )
-                            else:
-                                self.page.locator(scroll_selector).evaluate(
-                                    f"(el) => el.scrollBy(0, {retry_scroll_distance})"
-                                )
+                        self._scroll_by(scroll_selector, retry_scroll_distance, scroll_horizontal)
 
-
-                    time.sleep(retry_delay)
+                    self._wait_for_visible(button, retry_delay)
                     continue
                 elif stop_condition == "no-button":
                     break
@@ -236,13 +743,10 @@ class SyncBrowserCrawler:
                     raise CrawlerError("Button to load more dynamic content not detected.")
 
             # Click the button
+            known_count = self.page.locator(base_selector).count()
             button.first.click()
             total_clicks += 1
-            time.sleep(cycle_delay)
-
-            # Get updated content
-            html = self.page.content()
-            tree = HTMLParser(html)
+            self._wait_for_more_items(base_selector, known_count, cycle_delay)
 
             # Stop conditions
             if stop_condition == "count" and total_clicks >= max_clicks:
@@ -262,157 +766,570 @@ class SyncBrowserCrawler:
     # ---------------------------
     # Data Extraction
     # ---------------------------
-    def _extract_data(self, schema: SyncBrowserCrawlerSchema) -> List[Dict[str, Any]]:
-        html = self.page.content()
-        tree = HTMLParser(html)
+    def _extract_data(self, schema: SyncBrowserCrawlerSchema, tree: Optional[HTMLParser] = None, start: int = 0) -> List[Dict[str, Any]]:
         base_selector = schema.get("base_selector")
         if not base_selector:
             raise ValueError("Missing base_selector in schema")
 
-        items = tree.css(base_selector)
-        results = []
-
-        for item in items:
-            record: Dict[str, Any] = {}
-            for field in schema.get("fields", []):
+        fields = compile_fields(schema.get("fields", []))
+        if tree is None:
+            if _in_browser_extractable(schema, fields):
                 try:
-                    # Handle lists
-                    if field.get("type") == "list":
-                        record[field["name"]] = self._extract_list_field(item, field)
-                        continue
+                    rows = self.page.evaluate(_EXTRACT_JS, [base_selector, _browser_field_spec(fields)])
+                except PlaywrightError:
+                    # e.g. a selector only selectolax understands; parse the DOM instead
+                    rows = None
+                if rows is not None:
+                    return _records_from_browser_rows(rows, fields)
+            tree = HTMLParser(self.page.content())
 
-                    # Regular fields
-                    
-                    set_to_default = True
-                    raw = field.get("default")
-                    value = raw
-                    
-                    el = item.css_first(field["selector"]) if "selector" in field else None
-                    if el:
-                        set_to_default = False
-                        raw = el.attributes.get(field.get("attribute"), raw) if "attribute" in field else el.text()
-
-                    # Apply preformatter
-                    if field.get("preformatter") and callable(field["preformatter"]) and not set_to_default:
-                        raw = field["preformatter"](raw)
-                except Exception as e:
-                    raise CrawlerError(f"Failed to extract field {field.get('name')}: {e}")
+        # (target dict, steps) for the targets with follows across all rows, fetched together below
+        pending: List[tuple] = []
+        results = _extract_rows(tree, base_selector, fields, pending, start)
 
-                # Type conversion
-                if not set_to_default:
-                    value = self._cast_type(raw, field.get("type", "text"))
+        if pending:
+            self._resolve_follows(pending)
 
-                try:
-                    # Apply postformatter
-                    if field.get("postformatter") and callable(field["postformatter"]) and not set_to_default:
-                        value = field["postformatter"](value)
-
-                    # Nested URL-following: use a new page
-                    if "url_follow_schema" in field and isinstance(value, str):
-                        nested_data = []
-                        nested_page = self.context.new_page()
-                        nested_crawler = SyncBrowserCrawler.__new__(SyncBrowserCrawler)
-                        nested_crawler.context = self.context
-                        nested_crawler.page = nested_page
-                        if hasattr(self, "plawright"):
-                            nested_crawler.playwright = self.playwright
-                        nested_data = nested_crawler.fetch(value, field["url_follow_schema"])
-                        nested_page.close()
-
-                        if isinstance(nested_data, list):
-                            for nd in nested_data:
-                                record.update(nd)
-                        else:
-                            record.update(nested_data)
-                    else:
-                        record[field["name"]] = value
-                except Exception as e:
-                    raise CrawlerError(f"Failed to extract field {field.get('name')}: {e}")
-                    
+        return results
 
+    # ---------------------------
+    # URL Following
+    # ---------------------------
+    def _resolve_follows(self, pending: List[tuple]) -> None:
+        """
+        Fetch the url_follow_schema targets collected during extraction and merge them
+        into their records. Each distinct (url, schema) is fetched once, and for
+        `prefer_http` schemas the raw HTML of all targets is downloaded concurrently
+        before anything is rendered in the browser.
+        """
+        unique = follow_targets(pending)
 
-            results.append(record)
+        prefetch = [
+            key for key, (url, follow) in unique.items()
+            if _http_fast_path_allowed(follow) and not follow.get("url_pagination")
+            and (self._cache is None or self._cache.get(url, follow) is None)
+        ]
+        if len(prefetch) > 1:
+            # Workers share one session, so it must exist before they start
+            self._get_http_session()
+            with ThreadPoolExecutor(max_workers=min(len(prefetch), _FOLLOW_HTTP_WORKERS)) as pool:
+                trees = pool.map(lambda key: self._fetch_http(*unique[key]), prefetch)
+                self._prefetched.update(zip(prefetch, trees))
 
-        return results
+        nested: Dict[Tuple[str, int], List[Dict[str, Any]]] = {}
+        try:
+            for key, (url, follow) in unique.items():
+                if self._prefetched.get(key) is not None:
+                    # Already downloaded; no page needed
+                    nested[key] = self.fetch(url, follow)
+                else:
+                    nested[key] = self._follow(url, follow)
+        except Exception as e:
+            raise CrawlerError(f"Nested fetch failed: {e}") from e
+        finally:
+            for key in prefetch:
+                self._prefetched.pop(key, None)
 
-    def _extract_list_field(self, parent, field):
-        values: List[Any] = []
-        list_subfields = field.get("list_subfields")
-        selector = field["selector"]
-        attr = field.get("attribute")
-        default = field.get("default")
-        type_ = field.get("type", "text")
-        preformatter = field.get("preformatter")
-        postformatter = field.get("postformatter")
-        list_formatter = field.get("list_formatter")
-
-        for el in parent.css(selector):
-            if list_subfields:
-                obj: Dict[str, Any] = {}
-                for sub in list_subfields:
-                    sub_el = el.css_first(sub["selector"])
-                    subraw = sub.get("default")
-                    if sub_el:
-                        subraw = sub_el.attributes.get(sub.get("attribute"), subraw) if "attribute" in sub else sub_el.text()
-
-                    # Apply subfield formatters
-                    if sub.get("preformatter") and callable(sub["preformatter"]):
-                        subraw = sub["preformatter"](subraw)
-                    subval = self._cast_type(subraw, sub.get("type", "text"))
-                    if sub.get("postformatter") and callable(sub["postformatter"]):
-                        subval = sub["postformatter"](subval)
-
-                    # Nested URL-following inside lists
-                    if "url_follow_schema" in sub and isinstance(subval, str):
-                        nested_page = self.context.new_page()
-                        nested_crawler = SyncBrowserCrawler.__new__(SyncBrowserCrawler)
-                        nested_crawler.context = self.context
-                        nested_crawler.page = nested_page
-                        if hasattr(self, "playwright"):
-                            nested_crawler.playwright = self.playwright
-                        nested_data = nested_crawler.fetch(subval, sub["url_follow_schema"])
-                        nested_page.close()
-                        if isinstance(nested_data, list):
-                            for nd in nested_data:
-                                obj.update(nd)
-                        else:
-                            obj.update(nested_data)
-                    else:
-                        obj[sub["name"]] = subval
-                values.append(obj)
-            else:
-                raw = el.attributes.get(attr, default) if attr else el.text()
-                if preformatter:
-                    raw = preformatter(raw)
-                val = self._cast_type(raw, type_)
-                if postformatter:
-                    val = postformatter(val)
-                values.append(val)
-                
-        if list_formatter and callable(list_formatter):
-            values = list_formatter(values)
-        
-        return values
+        merge_follows(pending, nested)
 
-    def _cast_type(self, value, type_: str):
+    def _follow(self, url: str, schema: SyncBrowserCrawlerSchema) -> List[Dict[str, Any]]:
+        page = self._acquire_page()
         try:
-            if type_ == "number":
-                value = float(value)
-                if value.is_integer():
-                    value = int(value)
-            elif type_ == "json":
-                import json
-                value = json.loads(value)
-            else:
-                value = str(value)
-            return value
-        except Exception as e:
-            raise FormatterError(f"Failed to cast '{value}' to {type_}: {e}") from e
+            return self._fetch_with_page(page, url, schema)
+        finally:
+            self._release_page(page)
+
+    def _fetch_with_page(self, page: Page, url: str, schema: SyncBrowserCrawlerSchema) -> List[Dict[str, Any]]:
+        """Run `fetch` against `page` instead of the crawler's main page."""
+        outer_page = self.page
+        self.page = page
+        try:
+            return self.fetch(url, schema)
+        finally:
+            self.page = outer_page
+
+    def _set_resource_blocking(self, page: Page, block: bool) -> None:
+        """Install or remove the resource-blocking route so `page` matches the schema being fetched."""
+        if block == (page in self._blocking_pages):
+            return
+        if block:
+            page.route("**/*", _route_blocking_resources)
+            self._blocking_pages.add(page)
+        else:
+            page.unroute("**/*", _route_blocking_resources)
+            self._blocking_pages.discard(page)
+
+    def _acquire_page(self) -> Page:
+        if self._page_pool:
+            return self._page_pool.pop()
+        return self.context.new_page()
+
+    def _release_page(self, page: Page) -> None:
+        """Blank `page` and keep it for the next follow, or close it if the pool is full."""
+        if len(self._page_pool) < self._page_pool_size and not page.is_closed():
+            try:
+                if page.url != "about:blank":
+                    page.goto("about:blank")
+                self._page_pool.append(page)
+                return
+            except Exception:
+                pass
+        page.close()
 
     # ---------------------------
     # Cleanup
     # ---------------------------
     def close(self):
-        self.context.close()
-        if hasattr(self, "playwright"):
-            self.playwright.stop()
+        if getattr(self, "_http_session", None):
+            self._http_session.close()
+        for page in getattr(self, "_page_pool", []):
+            page.close()
+        self._page_pool = []
+        self._blocking_pages = set()
+        if getattr(self, "_pooled", False):
+            self._pool.release(self.context, self.headless)
+        else:
+            self.context.close()
+
+    @classmethod
+    def shutdown(cls):
+        """
+        Tear down the calling thread's shared browser pool. Registered with `atexit` for the
+        main thread; other threads' pools stop on their own once their last crawler closes.
+        """
+        _BrowserPool.shutdown()
+
+
+class AsyncBrowserPool:
+    """
+    A warm Chromium shared by the AsyncBrowserCrawlers of one event loop. Each crawler
+    gets a fresh context from `new_context()` and closes it when done; the browser is
+    only launched once and stays up until the pool is closed.
+
+        async with AsyncBrowserPool() as pool:
+            for url in urls:
+                async with AsyncBrowserCrawler(pool=pool) as crawler:
+                    ...
+    """
+
+    def __init__(self, headless: bool = True) -> None:
+        self.headless = headless
+        self._lock = asyncio.Lock()
+        self._playwright = None
+        self._browser = None
+
+    async def new_context(self) -> AsyncBrowserContext:
+        async with self._lock:
+            if self._browser is None or not self._browser.is_connected():
+                if self._playwright is None:
+                    self._playwright = await async_playwright().start()
+                self._browser = await self._playwright.chromium.launch(headless=self.headless)
+        return await self._browser.new_context()
+
+    async def close(self) -> None:
+        """Close the browser and stop the Playwright driver."""
+        async with self._lock:
+            if self._browser is not None and self._browser.is_connected():
+                await self._browser.close()
+            self._browser = None
+            if self._playwright is not None:
+                await self._playwright.stop()
+                self._playwright = None
+
+    async def __aenter__(self) -> "AsyncBrowserPool":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.close()
+
+
+class AsyncBrowserCrawler:
+    """
+    Asynchronous browser-based crawler using Playwright's async API.
+    Mirrors SyncBrowserCrawler, but URL-paginated pages and nested
+    `url_follow_schema` links are fetched concurrently, each on its own page
+    of a shared browser context, bounded by a semaphore (or an adaptive limit
+    with `concurrency=ConcurrencySettings(...)`).
+    """
+
+    def __init__(
+        self,
+        context: Optional[AsyncBrowserContext] = None,
+        headless: bool = True,
+        max_concurrency: int = 5,
+        cache_size: int = 0,
+        cache_ttl: Optional[float] = None,
+        parse_workers: int = 0,
+        concurrency: Optional[ConcurrencySettings] = None,
+        pool: Optional[AsyncBrowserPool] = None
+    ) -> None:
+        self.headless = headless
+        self.external_context = context
+        # Contexts come from this warm browser instead of a browser launched per crawler
+        self.pool = pool
+        self.context: Optional[AsyncBrowserContext] = context
+        # A fixed limit of max_concurrency pages, or an adaptive one when `concurrency` is given
+        self.semaphore = (
+            asyncio.Semaphore(max_concurrency) if concurrency is None
+            else AdaptiveLimiter(concurrency, (PlaywrightTimeoutError, asyncio.TimeoutError, aiohttp.ClientConnectionError))
+        )
+        self._context_lock = asyncio.Lock()
+        self._playwright = None
+        self._browser = None
+        self._http_session: Optional[aiohttp.ClientSession] = None
+        # Records of the last `cache_size` (url, schema) fetches, optionally expiring after `cache_ttl` seconds
+        self._cache = ResultCache(cache_size, cache_ttl) if cache_size > 0 else None
+        # With parse_workers > 0, HTML parsing and extraction of picklable, follow-free
+        # schemas runs in worker processes while this process keeps driving pages.
+        self._parse_pool = ProcessPoolExecutor(parse_workers) if parse_workers > 0 else None
+        # id(schema) -> (schema, offloadable)
+        self._offloadable: Dict[int, Tuple[dict, bool]] = {}
+
+    async def _get_context(self) -> AsyncBrowserContext:
+        async with self._context_lock:
+            if self.context is None and self.pool is not None:
+                self.context = await self.pool.new_context()
+            elif self.context is None:
+                self._playwright = await async_playwright().start()
+                self._browser = await self._playwright.chromium.launch(headless=self.headless)
+                self.context = await self._browser.new_context()
+        return self.context
+
+    async def close(self):
+        """Close the browser if it was internally launched."""
+        if self._http_session and not self._http_session.closed:
+            await self._http_session.close()
+        if self._parse_pool is not None:
+            self._parse_pool.shutdown(wait=False, cancel_futures=True)
+            self._parse_pool = None
+        if self.external_context:
+            return
+        if self.context:
+            await self.context.close()
+            self.context = None
+        if self._browser:
+            await self._browser.close()
+            self._browser = None
+        if self._playwright:
+            await self._playwright.stop()
+            self._playwright = None
+
+    async def fetch(
+        self,
+        url: str,
+        schema: AsyncBrowserCrawlerSchema,
+        *args,
+        cache: bool = True,
+        layout: Literal["rows", "columns"] = "rows",
+        **kwargs
+    ) -> Union[List[Dict[str, Any]], Dict[str, List[Any]]]:
+        """
+        Fetch data from a URL or paginated URLs using the provided schema.
+        Pass `cache=False` to bypass the result cache for this URL (nested follows still use it).
+        `layout="columns"` returns one list per field (see `records_to_columns`) instead of one dict per record.
+        """
+        result_cache = self._cache if cache else None
+        request = request_key(args, kwargs) if result_cache is not None else None
+        records = result_cache.get(url, schema, request) if result_cache is not None else None
+        if records is None:
+            if "url_pagination" in schema and schema["url_pagination"]:
+                records = await self._handle_url_pagination(url, schema, *args, **kwargs)
+            else:
+                records = await self._fetch_one(url, schema, *args, **kwargs)
+            if result_cache is not None:
+                result_cache.put(url, schema, records, request)
+        return records_to_columns(records) if layout == "columns" else records
+
+    def clear_cache(self) -> None:
+        """Drop all cached results."""
+        if self._cache is not None:
+            self._cache.clear()
+
+    async def _fetch_one(self, url: str, schema: AsyncBrowserCrawlerSchema, *args, **kwargs) -> List[Dict[str, Any]]:
+        on_pageload = schema.get("on_pageload")
+        wait_for_selector = schema.get("wait_for_selector")
+        kwargs.setdefault("wait_until", _DEFAULT_WAIT_UNTIL)
+
+        tree = await self._fetch_http(url, schema)
+        if tree is not None:
+            return await self._extract_data(tree, schema)
+
+        context = await self._get_context()
+
+        async with self.semaphore:
+            page = await context.new_page()
+            try:
+                try:
+                    if schema.get("block_resources"):
+                        await page.route("**/*", _route_blocking_resources_async)
+                    await page.goto(url, *args, **kwargs)
+                    if on_pageload and callable(on_pageload):
+                        result = on_pageload(page)
+                        if inspect.isawaitable(result):
+                            await result
+
+                    if wait_for_selector and wait_for_selector.get("selector"):
+                        await page.wait_for_selector(**wait_for_selector)
+                    elif schema.get("base_selector"):
+                        try:
+                            await page.wait_for_selector(schema["base_selector"], **_base_selector_wait_args(schema, kwargs))
+                        except PlaywrightTimeoutError:
+                            pass
+                except Exception as e:
+                    raise RequestError(f"Failed to crawl {url}: {e}")
+
+                if "scroll_pagination" in schema and schema["scroll_pagination"]:
+                    await self._handle_scroll_pagination(page, schema)
+                elif "button_pagination" in schema and schema["button_pagination"]:
+                    await self._handle_button_pagination(page, schema)
+
+                fields = compile_fields(schema.get("fields", []))
+                rows = None
+                if _in_browser_extractable(schema, fields):
+                    try:
+                        rows = await page.evaluate(_EXTRACT_JS, [schema["base_selector"], _browser_field_spec(fields)])
+                    except PlaywrightError:
+                        # e.g. a selector only selectolax understands; parse the DOM instead
+                        rows = None
+                if rows is not None:
+                    return _records_from_browser_rows(rows, fields)
+                html = await page.content()
+            finally:
+                await page.close()
+
+        # Extraction (and any nested follows) runs outside the semaphore so
+        # nested fetches can't deadlock waiting on their parent's slot.
+        if self._can_offload(schema):
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._parse_pool, _extract_html, html, schema)
+        return await self._extract_data(HTMLParser(html), schema)
+
+    def _can_offload(self, schema: AsyncBrowserCrawlerSchema) -> bool:
+        """Whether `schema` can be extracted in a parse worker: no url-follows, and picklable (no lambdas)."""
+        if self._parse_pool is None:
+            return False
+
+        entry = self._offloadable.get(id(schema))
+        if entry is None or entry[0] is not schema:
+            try:
+                pickle.dumps(schema)
+                offloadable = not _has_follows(compile_fields(schema.get("fields", [])))
+            except Exception:
+                offloadable = False
+            entry = self._offloadable[id(schema)] = (schema, offloadable)
+        return entry[1]
+
+    async def _fetch_http(self, url: str, schema: AsyncBrowserCrawlerSchema) -> Optional[HTMLParser]:
+        """
+        Async counterpart of SyncBrowserCrawler._fetch_http. Returns the parsed tree if it
+        already contains `base_selector` matches, otherwise None.
+        """
+        if not _http_fast_path_allowed(schema):
+            return None
+
+        if self._http_session is None or self._http_session.closed:
+            self._http_session = aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=10))
+        try:
+            async with self.semaphore:
+                async with self._http_session.get(url) as resp:
+                    resp.raise_for_status()
+                    html = await aiohttp_markup(resp)
+        except Exception:
+            return None
+
+        tree = HTMLParser(html)
+        return tree if tree.css_first(schema["base_selector"]) else None
+
+    # ---------------------------
+    # URL Pagination
+    # ---------------------------
+    async def _handle_url_pagination(self, url: str, schema: AsyncBrowserCrawlerSchema, *args, **kwargs) -> List[Dict[str, Any]]:
+        pagination: URLPaginationSchema = schema["url_pagination"]
+
+        start = pagination.get("start_page", 1)
+        end = pagination.get("end_page", 1)
+        placeholder = pagination.get("page_placeholder", "{page}")
+
+        tasks = [self._fetch_one(page_url, schema, *args, **kwargs) for page_url in page_urls(url, placeholder, start, end)]
+        pages = await asyncio.gather(*tasks)
+        return [record for records in pages for record in records]
+
+    # ---------------------------
+    # Scroll Pagination
+    # ---------------------------
+    async def _scroll_by(self, page: AsyncPage, scroll_selector: str, distance: int, horizontal: bool):
+        dx, dy = (distance, 0) if horizontal else (0, distance)
+        if scroll_selector == "window":
+            await page.evaluate(_SCROLL_WINDOW_JS, [dx, dy])
+        else:
+            await page.locator(scroll_selector).evaluate(_SCROLL_ELEMENT_JS, [dx, dy])
+
+    async def _wait_for_more_items(self, page: AsyncPage, base_selector: str, known_count: int, max_wait: float):
+        """Return once more than `known_count` items match `base_selector`, or after `max_wait` seconds."""
+        if max_wait <= 0:
+            return
+        try:
+            # Same locator as the counts, so items inside open shadow roots are seen by both
+            await page.locator(base_selector).nth(known_count).wait_for(state="attached", timeout=max_wait * 1000)
+        except PlaywrightTimeoutError:
+            pass
+
+    async def _wait_for_visible(self, locator: AsyncLocator, max_wait: float):
+        """Return once `locator` has a visible match, or after `max_wait` seconds."""
+        if max_wait <= 0:
+            return
+        try:
+            await locator.first.wait_for(state="visible", timeout=max_wait * 1000)
+        except PlaywrightTimeoutError:
+            pass
+
+    async def _handle_scroll_pagination(self, page: AsyncPage, schema: AsyncBrowserCrawlerSchema):
+        pagination = schema["scroll_pagination"]
+        stop_condition = pagination.get("stop_condition", "count")
+        scroll_delay = pagination.get("scroll_delay", 1.5)
+        scroll_distance = pagination.get("scroll_distance", 1000)
+        scroll_selector = pagination.get("scroll_selector", "window")
+        base_selector = schema["base_selector"]
+        retry_limit = pagination.get("retry_limit", 3)
+        retry_scroll_distance = pagination.get("retry_scroll_distance", 0)
+        scroll_horizontal = pagination.get("scroll_horizontal", False)
+        on_scroll = schema.get("on_scroll")
+
+        total_scrolls = 0
+        previous_count = 0
+        retry_counter = 0
+        current_count = await page.locator(base_selector).count()
+
+        while True:
+            await self._scroll_by(page, scroll_selector, scroll_distance, scroll_horizontal)
+
+            if on_scroll and callable(on_scroll):
+                result = on_scroll(page)
+                if inspect.isawaitable(result):
+                    await result
+
+            await self._wait_for_more_items(page, base_selector, current_count, scroll_delay)
+            total_scrolls += 1
+
+            current_count = await page.locator(base_selector).count()
+
+            if stop_condition == "count":
+                max_scrolls = pagination.get("scroll_count", 5)
+                if total_scrolls >= max_scrolls:
+                    break
+            elif stop_condition == "element":
+                stop_selector = pagination.get("stop_selector")
+                if stop_selector:
+                    elements = page.locator(stop_selector)
+                    if await elements.count() > 0 and await elements.first.is_visible():
+                        break
+            elif stop_condition == "no-new-elements":
+                if current_count == previous_count:
+                    retry_counter += 1
+                    if retry_scroll_distance != 0:
+                        await self._scroll_by(page, scroll_selector, retry_scroll_distance, scroll_horizontal)
+                    if retry_counter >= retry_limit:
+                        break
+                else:
+                    retry_counter = 0
+                    previous_count = current_count
+
+    # ---------------------------
+    # Button Pagination
+    # ---------------------------
+    async def _handle_button_pagination(self, page: AsyncPage, schema: AsyncBrowserCrawlerSchema):
+        pagination = schema.get("button_pagination")
+        if not pagination:
+            return
+
+        scroll_distance = pagination.get("scroll_distance", 0)
+        cycle_delay = pagination.get("cycle_delay", 1.5)
+        retry_delay = pagination.get("retry_delay", 2)
+        scroll_selector = pagination.get("scroll_selector", "window")
+        retry_limit = pagination.get("retry_limit", 3)
+        retry_scroll_distance = pagination.get("retry_scroll_distance", 0)
+        scroll_horizontal = pagination.get("scroll_horizontal", False)
+
+        stop_condition = pagination.get("stop_condition", "no-button")
+        button_selector = pagination.get("button_selector")
+        base_selector = schema.get("base_selector")
+        total_scrolls = 0
+        retry_counter = 0
+        total_clicks = 0
+        max_clicks = pagination.get("click_count", 5) if stop_condition == "count" else None
+        stop_selector = pagination.get("stop_selector") if stop_condition == "element" else None
+        on_scroll = schema.get("on_scroll")
+
+        while True:
+            if scroll_distance != 0:
+                known_count = await page.locator(base_selector).count()
+                await self._scroll_by(page, scroll_selector, scroll_distance, scroll_horizontal)
+
+                if on_scroll and callable(on_scroll):
+                    result = on_scroll(page)
+                    if inspect.isawaitable(result):
+                        await result
+
+                await self._wait_for_more_items(page, base_selector, known_count, cycle_delay)
+                total_scrolls += 1
+
+            button = page.locator(button_selector)
+            if await button.count() == 0 or not await button.first.is_visible():
+                if retry_counter < retry_limit:
+                    retry_counter += 1
+                    if retry_scroll_distance != 0:
+                        await self._scroll_by(page, scroll_selector, retry_scroll_distance, scroll_horizontal)
+                    await self._wait_for_visible(button, retry_delay)
+                    continue
+                elif stop_condition == "no-button":
+                    break
+                else:
+                    raise CrawlerError("Button to load more dynamic content not detected.")
+
+            known_count = await page.locator(base_selector).count()
+            await button.first.click()
+            total_clicks += 1
+            await self._wait_for_more_items(page, base_selector, known_count, cycle_delay)
+
+            if stop_condition == "count" and total_clicks >= max_clicks:
+                break
+            elif stop_condition == "element" and stop_selector:
+                stop_elements = page.locator(stop_selector)
+                if await stop_elements.count() > 0 and await stop_elements.first.is_visible():
+                    break
+            if "scroll_count" in pagination and total_scrolls >= pagination["scroll_count"]:
+                break
+            elif "stop_selector" in pagination and pagination["stop_selector"]:
+                if await page.locator(pagination["stop_selector"]).count() > 0:
+                    break
+
+    # ---------------------------
+    # Data Extraction
+    # ---------------------------
+    async def _extract_data(self, tree: HTMLParser, schema: AsyncBrowserCrawlerSchema) -> List[Dict[str, Any]]:
+        base_selector = schema.get("base_selector")
+        if not base_selector:
+            raise ValueError("Missing base_selector in schema")
+
+        fields = compile_fields(schema.get("fields", []))
+        # (target dict, steps) for the targets with follows across all rows, fetched together below
+        pending: List[tuple] = []
+        results = _extract_rows(tree, base_selector, fields, pending)
+
+        if pending:
+            # Each distinct (url, schema) is fetched once, however many rows point at it
+            unique = follow_targets(pending)
+            try:
+                fetched = await asyncio.gather(*(self.fetch(url, follow) for url, follow in unique.values()))
+            except Exception as e:
+                raise CrawlerError(f"Nested async fetch failed: {e}") from e
+            merge_follows(pending, dict(zip(unique, fetched)))
+
+        return results
+
+    async def __aenter__(self):
+        await self._get_context()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
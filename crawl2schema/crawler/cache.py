@@ -0,0 +1,72 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+
+def _frozen(value):
+    """`value` as a hashable key: dicts, lists and tuples by contents, other unhashables by identity."""
+    if isinstance(value, dict):
+        return (dict, tuple((key, _frozen(item)) for key, item in value.items()))
+    if isinstance(value, (list, tuple)):
+        return (type(value), tuple(_frozen(item) for item in value))
+    try:
+        hash(value)
+    except TypeError:
+        return (object, id(value))
+    return value
+
+
+def request_key(args: tuple, kwargs: dict) -> tuple:
+    """The request arguments of a fetch (headers, cookies, params...) as a hashable key."""
+    if not args and not kwargs:
+        return ()
+    return _frozen(args), _frozen(kwargs)
+
+
+class ResultCache:
+    """
+    In-memory LRU of extracted records, keyed by URL, schema identity and the
+    fetch's request arguments (see `request_key`).
+    Lets repeated fetches of the same page (retries, shared `url_follow_schema`
+    targets, re-runs in one process) skip the network and extraction entirely.
+    """
+
+    def __init__(self, maxsize: int = 256, ttl: Optional[float] = None) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        # (url, id(schema), request key) -> (schema, stored_at, records). The schema is kept so a
+        # recycled id can't serve another schema's records.
+        self._entries: "OrderedDict[Tuple[str, int, tuple], Tuple[dict, float, List[Dict[str, Any]]]]" = OrderedDict()
+        # SyncHTTPCrawler fetches follows on worker threads
+        self._lock = threading.Lock()
+
+    def get(self, url: str, schema: dict, request: tuple = ()) -> Optional[List[Dict[str, Any]]]:
+        key = (url, id(schema), request)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] is not schema:
+                return None
+            if self.ttl is not None and time.monotonic() - entry[1] > self.ttl:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+
+        # Shallow copies so callers (and nested follows merging into records) can't edit the cache
+        return [dict(record) for record in entry[2]]
+
+    def put(self, url: str, schema: dict, records: List[Dict[str, Any]], request: tuple = ()) -> None:
+        key = (url, id(schema), request)
+        entry = (schema, time.monotonic(), [dict(record) for record in records])
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -0,0 +1,420 @@
+import re
+import sys
+import json
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from crawl2schema.exceptions import CrawlerError, FormatterError, InvalidSchema
+
+try:
+    import orjson
+except ImportError:  # optional, only speeds up "json" fields
+    orjson = None
+
+
+def _to_number(value):
+    # Values a preformatter already made numeric skip the float() round trip
+    if type(value) is int:
+        return value
+    if type(value) is not float:
+        value = float(value)
+    return int(value) if value.is_integer() else value
+
+
+def _orjson_loads(value):
+    """
+    `orjson.loads`, deferring to `json.loads` for anything it rejects: NaN/Infinity
+    and integers beyond 64 bits parse as before, and invalid input raises the usual error.
+    """
+    try:
+        return orjson.loads(value)
+    except orjson.JSONDecodeError:
+        return json.loads(value)
+
+
+# Field "type" -> cast callable. Anything not listed is cast with str.
+CASTERS: Dict[str, Callable[[Any], Any]] = {
+    "number": _to_number,
+    "json": json.loads if orjson is None else _orjson_loads,
+    "text": str,
+}
+
+
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+def normalize_whitespace(value):
+    """Collapse whitespace runs to one space and strip, in a single regex pass. Non-strings pass through."""
+    if isinstance(value, str):
+        return _WHITESPACE_RE.sub(" ", value).strip()
+    return value
+
+
+def _interned(value):
+    """
+    `sys.intern` for strings, anything else unchanged. Equal selectors, attributes and
+    names across fields and schemas then share one object, so the dict lookups keyed
+    on them (per-item memos, records) match by identity.
+    """
+    return sys.intern(value) if type(value) is str else value
+
+
+def _formatter(field: dict, key: str) -> Optional[Callable]:
+    """
+    Read a formatter from a field, rejecting non-callables once here instead of per row.
+    Raised as FormatterError, the CrawlerError calling one used to fail with.
+    """
+    formatter = field.get(key)
+    if formatter is not None and not callable(formatter):
+        raise FormatterError(f"'{key}' of field '{field.get('name')}' must be callable, got {type(formatter).__name__}")
+    return formatter
+
+
+def _pattern_extractor(field: dict) -> Callable[[Any], Any]:
+    """
+    The field's `pattern`, compiled once: values become the pattern's first group
+    (or the whole match when it has no groups), and values it doesn't match raise.
+    Non-strings (e.g. the default of a missing attribute) pass through.
+    """
+    try:
+        regex = re.compile(field["pattern"])
+    except (re.error, TypeError) as e:
+        raise InvalidSchema(f"Invalid 'pattern' for field '{field.get('name')}': {e}") from e
+    group = 1 if regex.groups else 0
+
+    def extract_match(value):
+        if not isinstance(value, str):
+            return value
+        match = regex.search(value)
+        if match is None:
+            raise ValueError(f"{value!r} does not match {regex.pattern!r}")
+        return match.group(group)
+
+    return extract_match
+
+
+def _preformatter_for(field: dict) -> Optional[Callable]:
+    """
+    The field's preformatter, preceded by whitespace normalization and then `pattern`
+    extraction when the field asks for them.
+    """
+    steps = []
+    if field.get("normalize_whitespace"):
+        steps.append(normalize_whitespace)
+    if field.get("pattern") is not None:
+        steps.append(_pattern_extractor(field))
+    preformatter = _formatter(field, "preformatter")
+    if preformatter is not None:
+        steps.append(preformatter)
+
+    if len(steps) <= 1:
+        return steps[0] if steps else None
+    if len(steps) == 2:
+        first, second = steps
+        return lambda value: second(first(value))
+
+    def chained(value):
+        for step in steps:
+            value = step(value)
+        return value
+
+    return chained
+
+
+def css_first_memo(node, selector: str, memo: Dict[str, Any]):
+    """
+    `node.css_first(selector)` memoized per item. Fields sharing a selector
+    (e.g. an anchor's text and its href) reuse one traversal.
+    """
+    try:
+        return memo[selector]
+    except KeyError:
+        el = memo[selector] = node.css_first(selector)
+        return el
+
+
+# A single compound selector (no combinators, lists or functional pseudo-classes),
+# whose matches under a parent are exactly its matches under "{base} {selector}"
+_COMPOUND_SELECTOR_RE = re.compile(r"[^\s,>+~()]+")
+# Below this many parents the extra queries cost more than the css_first calls they save
+_PREFETCH_MIN_PARENTS = 16
+
+
+def prefetch_first_matches(tree, base_selector: str, parents: list, fields) -> Optional[List[Dict[str, Any]]]:
+    """
+    Resolve `css_first` for the scalar fields' compound selectors across every parent at
+    once: one "{base_selector} {selector}" query per selector, with each match assigned to
+    its nearest parent, instead of one css_first per parent and field.
+    Returns one memo dict per parent for `css_first_memo`, or None when the page doesn't
+    qualify (few parents, a selector-list base, or parents nested in each other).
+    """
+    if len(parents) < _PREFETCH_MIN_PARENTS or "," in base_selector:
+        return None
+    selectors = {
+        field.selector for field in fields
+        if field.extract is not None and field.selector and _COMPOUND_SELECTOR_RE.fullmatch(field.selector)
+    }
+    if not selectors:
+        return None
+
+    try:
+        # A node under two parents would need per-parent css_first to pick its owner
+        if tree.css_first(f"{base_selector} {base_selector}") is not None:
+            return None
+
+        index = {parent.mem_id: i for i, parent in enumerate(parents)}
+        memos = [dict.fromkeys(selectors) for _ in parents]
+        for selector in selectors:
+            for node in tree.css(f"{base_selector} {selector}"):
+                owner = node.parent
+                while owner is not None and owner.mem_id not in index:
+                    owner = owner.parent
+                if owner is not None:
+                    memo = memos[index[owner.mem_id]]
+                    if memo[selector] is None:
+                        memo[selector] = node
+            # css_first includes the parent itself, which precedes all its descendants
+            for node in tree.css(selector):
+                i = index.get(node.mem_id)
+                if i is not None:
+                    memos[i][selector] = node
+    except Exception:
+        # Invalid selectors are reported by the regular per-parent path
+        return None
+    return memos
+
+
+def record_template(fields) -> Optional[Dict[str, Any]]:
+    """
+    An empty record pre-keyed with the field names in order. Rows start from
+    `template.copy()`, so filling them never resizes the dict. None when a field
+    follows URLs, since those merge other keys in place of their own.
+    """
+    if any(field.url_follow_schema for field in fields):
+        return None
+    return dict.fromkeys(field.name for field in fields)
+
+
+def follow_targets(pending: List[tuple]) -> Dict[Tuple[str, int], Tuple[str, dict]]:
+    """The distinct follows of `pending`, (url, id(follow schema)) -> (url, follow schema), in page order."""
+    targets: Dict[Tuple[str, int], Tuple[str, dict]] = {}
+    for _, steps in pending:
+        for _, url, follow in steps:
+            if follow is not None:
+                targets.setdefault((url, id(follow)), (url, follow))
+    return targets
+
+
+def merge_follows(pending: List[tuple], nested: Dict[Tuple[str, int], List[Dict[str, Any]]]) -> None:
+    """
+    Rebuild the records whose url follows were deferred, merging each follow's records
+    where its field stands, as if it were fetched in place: later fields override the
+    merged keys, earlier ones are overridden by them, and keys keep their first position.
+    `pending` holds (record, steps), steps being the record's fields in order as
+    (name, value, follow schema) with the url as value; `nested` the fetched follows.
+    """
+    for record, steps in pending:
+        record.clear()
+        for name, value, follow in steps:
+            if follow is None:
+                record[name] = value
+            else:
+                for item in nested[(value, id(follow))]:
+                    record.update(item)
+
+
+def page_urls(url: str, placeholder: str, start: int, end: int) -> List[str]:
+    """
+    `url` with every `placeholder` replaced by each page number from `start` to `end`.
+    The url is split around the placeholder once instead of being rescanned per page.
+    """
+    if not placeholder:
+        return [url.replace(placeholder, str(i)) for i in range(start, end + 1)]
+    parts = url.split(placeholder)
+    return [str(i).join(parts) for i in range(start, end + 1)]
+
+
+def records_to_columns(records: List[Dict[str, Any]]) -> Dict[str, List[Any]]:
+    """
+    Transpose records into one list per key (`fetch(..., layout="columns")`), ready for
+    `pandas.DataFrame(columns)` or `pyarrow.Table.from_pydict(columns)`. Keys keep their
+    first-seen order; a record missing a key (e.g. a follow that matched nothing) gives None.
+    """
+    if not records:
+        return {}
+    keys = records[0].keys()
+    if all(record.keys() == keys for record in records):
+        return {key: [record[key] for record in records] for key in keys}
+
+    columns: Dict[str, List[Any]] = {}
+    for record in records:
+        for key in record:
+            if key not in columns:
+                columns[key] = []
+    for key, column in columns.items():
+        column.extend(record.get(key) for record in records)
+    return columns
+
+
+@dataclass(frozen=True, slots=True)
+class CompiledField:
+    """
+    Flattened, read-only view of a field schema.
+    Built once per schema so extraction loops read slot attributes
+    instead of repeating `field.get(...)` lookups for every element.
+    """
+    name: Optional[str]
+    selector: Optional[str]
+    attribute: Optional[str]
+    default: Any
+    type_: str
+    preformatter: Optional[Callable]
+    postformatter: Optional[Callable]
+    list_formatter: Optional[Callable]
+    url_follow_schema: Optional[dict]
+    list_subfields: Optional[Tuple["CompiledField", ...]]
+    # record_template(list_subfields), shared by every object of a structured list
+    subfield_template: Optional[Dict[str, Any]]
+    # extract(item, memo) -> value for non-list fields, None for lists
+    extract: Optional[Callable[[Any, Dict[str, Any]], Any]]
+
+
+# (id(fields), make_extractor) -> (fields, len(fields), compiled). The fields list
+# itself is kept so a recycled id can never return another schema's compiled fields.
+_COMPILED_FIELDS: "OrderedDict[Tuple[int, Callable], Tuple[list, int, Tuple[CompiledField, ...]]]" = OrderedDict()
+_COMPILED_FIELDS_MAXSIZE = 2048
+# Guards _COMPILED_FIELDS; crawlers compile from follow worker threads
+_COMPILED_FIELDS_LOCK = threading.Lock()
+
+
+def make_extractor(
+    field: dict,
+    preformatter: Optional[Callable],
+    postformatter: Optional[Callable],
+    select_error: type = CrawlerError,
+    format_error: type = CrawlerError,
+    caster_fallback: Optional[Callable[[Any], Any]] = str,
+) -> Callable[[Any, Dict[str, Any]], Any]:
+    """
+    Build the per-row extraction closure for a scalar field, from its compiled pre- and
+    postformatter. Every schema lookup is resolved here, so the closure only selects,
+    formats and casts; fields without formatters get a leaner closure. A missing element
+    yields the default untouched.
+    Invalid selectors raise `select_error`, failing formatters `format_error` and failed
+    casts FormatterError; types without a caster use `caster_fallback`, or are left as
+    extracted when it is None.
+    """
+    name = field.get("name")
+    selector = _interned(field.get("selector"))
+    attribute = _interned(field.get("attribute"))
+    default = field.get("default")
+    type_ = field.get("type", "text")
+    caster = CASTERS.get(type_, caster_fallback)
+
+    if caster is str and preformatter is None and postformatter is None:
+        # The common plain-text field: text() is already a str, so only defaults need casting
+        def extract_text(item, memo: Dict[str, Any]):
+            if not selector:
+                return default
+            try:
+                el = memo[selector]
+            except KeyError:
+                try:
+                    el = memo[selector] = item.css_first(selector)
+                except Exception as e:
+                    raise select_error(f"Invalid selector '{selector}' in field '{name}': {e}")
+            if not el:
+                return default
+
+            raw = el.attributes.get(attribute, default) if attribute else el.text()
+            if type(raw) is str:
+                return raw
+            try:
+                return str(raw)
+            except Exception as e:
+                raise FormatterError(f"Failed to cast '{raw}' to {type_}: {e}") from e
+
+        return extract_text
+
+    def extract(item, memo: Dict[str, Any]):
+        if not selector:
+            return default
+        try:
+            el = css_first_memo(item, selector, memo)
+        except Exception as e:
+            raise select_error(f"Invalid selector '{selector}' in field '{name}': {e}")
+        if not el:
+            return default
+
+        value = el.attributes.get(attribute, default) if attribute else el.text()
+        if preformatter is not None:
+            try:
+                value = preformatter(value)
+            except Exception as e:
+                raise format_error(f"Preformatter failed on value '{value}': {e}") from e
+        if caster is not None:
+            try:
+                value = caster(value)
+            except Exception as e:
+                raise FormatterError(f"Failed to cast '{value}' to {type_}: {e}") from e
+        if postformatter is not None:
+            try:
+                value = postformatter(value)
+            except Exception as e:
+                raise format_error(f"Postformatter failed on value '{value}': {e}") from e
+        return value
+
+    return extract
+
+
+def _compile_field(field: dict, make_extractor: Callable[..., Callable]) -> CompiledField:
+    list_subfields = field.get("list_subfields")
+    subfields = compile_fields(list_subfields, make_extractor) if list_subfields else None
+    is_list = field.get("type", "text") == "list"
+    preformatter = _preformatter_for(field)
+    postformatter = _formatter(field, "postformatter")
+    return CompiledField(
+        # Interned, so the keys of every record and merged follow share one string
+        name=_interned(field.get("name")),
+        selector=_interned(field.get("selector")),
+        attribute=_interned(field.get("attribute")),
+        default=field.get("default"),
+        type_=field.get("type", "text"),
+        preformatter=preformatter,
+        postformatter=postformatter,
+        list_formatter=_formatter(field, "list_formatter"),
+        url_follow_schema=field.get("url_follow_schema"),
+        list_subfields=subfields,
+        subfield_template=record_template(subfields) if subfields else None,
+        extract=None if is_list else make_extractor(field, preformatter, postformatter),
+    )
+
+
+def compile_fields(
+    fields: List[dict],
+    make_extractor: Callable[..., Callable[[Any, Dict[str, Any]], Any]] = make_extractor,
+) -> Tuple[CompiledField, ...]:
+    """
+    Compile a schema's `fields` list, memoized by identity.
+    `make_extractor(field, preformatter, postformatter)` builds each scalar field's
+    `extract` closure; crawlers with other error semantics pass a `make_extractor`
+    partial.
+    Schemas are expected not to be edited in place after their first fetch;
+    appending or removing fields is detected, editing a field dict is not.
+    """
+    key = (id(fields), make_extractor)
+    with _COMPILED_FIELDS_LOCK:
+        entry = _COMPILED_FIELDS.get(key)
+        if entry is not None and entry[0] is fields and entry[1] == len(fields):
+            _COMPILED_FIELDS.move_to_end(key)
+            return entry[2]
+
+    # Compiled outside the lock: subfields and follow schemas compile recursively.
+    # Two threads may compile the same fields at once; either result is equivalent.
+    compiled = tuple(_compile_field(field, make_extractor) for field in fields)
+    with _COMPILED_FIELDS_LOCK:
+        _COMPILED_FIELDS[key] = (fields, len(fields), compiled)
+        if len(_COMPILED_FIELDS) > _COMPILED_FIELDS_MAXSIZE:
+            _COMPILED_FIELDS.popitem(last=False)
+    return compiled
@@ -0,0 +1,107 @@
+import asyncio
+import math
+import time
+from dataclasses import dataclass
+from typing import Dict, Optional, Tuple, Type
+
+
+@dataclass(frozen=True)
+class ConcurrencySettings:
+    """
+    Bounds for an async crawler's adaptive concurrency. The crawler starts at
+    `desired_concurrency` requests in flight and moves between `min_concurrency`
+    and `max_concurrency` as hosts keep up or push back. `max_tasks_per_minute`
+    caps how often requests may start, whatever the concurrency.
+    """
+    min_concurrency: int = 1
+    max_concurrency: int = 50
+    desired_concurrency: int = 4
+    max_tasks_per_minute: float = math.inf
+
+
+# Response statuses that mean "slow down"
+_OVERLOAD_STATUSES = (429, 503)
+
+
+class AdaptiveLimiter:
+    """
+    Drop-in replacement for an asyncio.Semaphore whose limit adapts (AIMD): after a
+    full round of requests that succeeded without latency growing past twice the
+    fastest seen, one more slot opens; a timeout, connection error or 429/503 halves
+    the limit. Used as `async with limiter:` from one task per request, like the
+    semaphore it replaces.
+    """
+
+    def __init__(
+        self,
+        settings: ConcurrencySettings,
+        overload_errors: Tuple[Type[BaseException], ...] = (TimeoutError, ConnectionError),
+    ) -> None:
+        if not 1 <= settings.min_concurrency <= settings.max_concurrency:
+            raise ValueError("ConcurrencySettings needs 1 <= min_concurrency <= max_concurrency")
+        if settings.max_tasks_per_minute <= 0:
+            raise ValueError("ConcurrencySettings.max_tasks_per_minute must be positive")
+        self.settings = settings
+        self.overload_errors = overload_errors
+        self.limit = min(max(settings.desired_concurrency, settings.min_concurrency), settings.max_concurrency)
+        self._interval = 60 / settings.max_tasks_per_minute
+        self._next_start = 0.0
+        self._active = 0
+        self._cond = asyncio.Condition()
+        self._fastest: Optional[float] = None
+        self._good_streak = 0
+        # Task -> start time of the request it is running under the limiter
+        self._started: Dict["asyncio.Task", float] = {}
+
+    async def __aenter__(self) -> "AdaptiveLimiter":
+        if self._interval:
+            # Reserve the next start time first, so concurrent callers space out behind it
+            now = time.monotonic()
+            start = max(now, self._next_start)
+            self._next_start = start + self._interval
+            if start > now:
+                await asyncio.sleep(start - now)
+
+        async with self._cond:
+            await self._cond.wait_for(lambda: self._active < self.limit)
+            self._active += 1
+        self._started[asyncio.current_task()] = time.monotonic()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        started = self._started.pop(asyncio.current_task(), None)
+        if exc is None:
+            if started is not None:
+                self._on_success(time.monotonic() - started)
+        elif self._is_overload(exc):
+            self._on_overload()
+
+        # Freed before taking the lock, so a cancellation below can't leak the slot
+        self._active -= 1
+        async with self._cond:
+            if self._active < self.limit:
+                self._cond.notify(self.limit - self._active)
+
+    def _is_overload(self, exc: Optional[BaseException]) -> bool:
+        # Crawlers wrap transport errors; look through the exception chain
+        while exc is not None:
+            if isinstance(exc, self.overload_errors) or getattr(exc, "status", None) in _OVERLOAD_STATUSES:
+                return True
+            exc = exc.__cause__ or exc.__context__
+        return False
+
+    def _on_success(self, latency: float) -> None:
+        if self._fastest is None or latency < self._fastest:
+            self._fastest = latency
+        if latency > 2 * self._fastest:
+            self._good_streak = 0
+            return
+        self._good_streak += 1
+        if self._good_streak >= self.limit and self.limit < self.settings.max_concurrency:
+            # The slot this opens is handed out by the notify in __aexit__
+            self.limit += 1
+            self._good_streak = 0
+
+    def _on_overload(self) -> None:
+        self.limit = max(self.settings.min_concurrency, self.limit // 2)
+        self._good_streak = 0
@@ -1,11 +1,226 @@
-from typing import List, Dict, Any, Callable, Optional
+from typing import AsyncIterator, List, Dict, Any, Literal, Optional, Tuple, Union
 import asyncio
+import inspect
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 import aiohttp
-import json
-from selectolax.parser import HTMLParser
-from ..schema import HTTPCrawlerSchema, HTTPFieldSchema, URLPaginationSchema
+try:
+    from selectolax.lexbor import LexborHTMLParser as HTMLParser
+except ImportError:  # selectolax builds without the Lexbor backend
+    from selectolax.parser import HTMLParser
+from ..schema import HTTPCrawlerSchema, URLPaginationSchema
+from ..cache import ResultCache, request_key
+from ..concurrency import AdaptiveLimiter, ConcurrencySettings
+from ..compiler import CASTERS, CompiledField, compile_fields, css_first_memo, follow_targets, make_extractor, merge_follows, page_urls, prefetch_first_matches, record_template, records_to_columns
 from ...exceptions import InvalidSchema, CrawlerError, FormatterError, PaginationError, ParseError, RequestError
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import httpx
+except ImportError:  # optional, only needed for http2_session()
+    httpx = None
+
+try:
+    import aiodns
+except ImportError:  # optional, resolves hostnames for AsyncHTTPCrawler without a thread pool
+    aiodns = None
+
+# Transport errors SyncHTTPCrawler reports as RequestError, for requests and httpx sessions
+_REQUEST_ERRORS = (requests.RequestException,) if httpx is None else (requests.RequestException, httpx.HTTPError)
+
+
+# Longest Retry-After, in seconds, pooled_session() sleeps for before retrying
+_MAX_RETRY_AFTER = 10.0
+
+
+class _CappedRetry(Retry):
+    """Retry that honours Retry-After only up to `_MAX_RETRY_AFTER` seconds."""
+
+    def get_retry_after(self, response):
+        retry_after = super().get_retry_after(response)
+        if retry_after is None:
+            return None
+        return min(retry_after, _MAX_RETRY_AFTER)
+
+
+def pooled_session() -> requests.Session:
+    """
+    A requests Session with room for many keep-alive connections per host, retrying
+    connection errors and 429/5xx responses up to 3 times with backoff. A Retry-After
+    header is honoured for at most `_MAX_RETRY_AFTER` seconds.
+    """
+    session = requests.Session()
+    retry = _CappedRetry(
+        total=3,
+        backoff_factor=0.3,
+        status_forcelist=(429, 500, 502, 503, 504),
+        # Hand the last response back so raise_for_status reports it as before
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(pool_connections=32, pool_maxsize=64, max_retries=retry)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+def http2_session(**kwargs) -> "httpx.Client":
+    """
+    An HTTP/2 `httpx.Client` for `SyncHTTPCrawler(session=...)`, multiplexing requests
+    to a host over one connection. Needs `pip install "httpx[http2]"`; keyword arguments
+    are passed to `httpx.Client`. `on_pageload` then receives `httpx.Response` objects.
+    """
+    if httpx is None:
+        raise ImportError('http2_session() requires httpx: pip install "httpx[http2]"')
+    kwargs.setdefault("limits", httpx.Limits(max_keepalive_connections=32, max_connections=64))
+    # requests follows redirects by default, httpx doesn't
+    kwargs.setdefault("follow_redirects", True)
+    return httpx.Client(http2=True, **kwargs)
+
+
+_UTF8 = ("utf-8", "utf8")
+
+
+def response_markup(response: requests.Response) -> Union[str, bytes]:
+    """
+    A requests response body for HTMLParser. Bodies declared as UTF-8 are passed as
+    bytes, skipping a decode the parser would immediately undo; anything else is
+    decoded by requests, since Lexbor reads raw bytes as UTF-8.
+    """
+    if (response.encoding or "").lower() in _UTF8:
+        return response.content
+    return response.text
+
+
+async def aiohttp_markup(response: aiohttp.ClientResponse) -> Union[str, bytes]:
+    """`response_markup` for aiohttp responses."""
+    if (response.charset or "").lower() in _UTF8:
+        return await response.read()
+    return await response.text()
+
+
+def _pagination_urls(url: str, schema: HTTPCrawlerSchema) -> List[str]:
+    """The page URLs a fetch of `url` covers: just `url`, or one per page of `url_pagination`."""
+    pagination = schema.get("url_pagination")
+    if pagination is None:
+        return [url]
+    try:
+        start = pagination.get("start_page", 1)
+        end = pagination["end_page"]
+        placeholder = pagination.get("page_placeholder", "{page}")
+        return page_urls(url, placeholder, start, end)
+    except Exception as e:
+        raise PaginationError(f"Invalid pagination schema: {e}")
+
+
+# Scalar fields with the HTTP crawlers' semantics: invalid selectors raise ParseError,
+# formatter failures FormatterError, and types without a caster are left as extracted
+_make_http_extractor = partial(make_extractor, select_error=ParseError, format_error=FormatterError, caster_fallback=None)
+
+
+def _extract_records(tree: HTMLParser, schema: HTTPCrawlerSchema, fields: Tuple[CompiledField, ...]) -> Tuple[List[Dict[str, Any]], List[tuple]]:
+    """
+    Extract every record of a page for both HTTP crawlers, returning them with the
+    records whose follows are still to fetch, as (record, steps) for `merge_follows`.
+    """
+    try:
+        base_elements = tree.css(schema.get("base_selector", "body"))
+    except Exception as e:
+        raise ParseError(f"Invalid base_selector '{schema.get('base_selector')}', error: {e}")
+
+    records: List[Dict[str, Any]] = []
+    pending: List[tuple] = []
+
+    memos = prefetch_first_matches(tree, schema.get("base_selector", "body"), base_elements, fields)
+    template = record_template(fields)
+
+    for i, parent in enumerate(base_elements):
+        record: Dict[str, Any] = template.copy() if template is not None else {}
+        memo: Dict[str, Any] = memos[i] if memos else {}
+        # From the record's first follow on, its fields are kept in order as (name, value, follow schema)
+        steps: Optional[List[tuple]] = None
+        for field in fields:
+            if field.extract is None:
+                value = _extract_list_field(parent, field)
+            else:
+                value = field.extract(parent, memo)
+                url_follow_schema = field.url_follow_schema
+                if url_follow_schema and isinstance(value, str):
+                    if steps is None:
+                        steps = [(name, v, None) for name, v in record.items()]
+                        pending.append((record, steps))
+                    steps.append((field.name, value, url_follow_schema))
+                    continue
+
+            if steps is None:
+                record[field.name] = value
+            else:
+                steps.append((field.name, value, None))
+
+        records.append(record)
+    return records, pending
+
+
+def _extract_list_field(parent, field: CompiledField) -> List[Any]:
+    values: List[Any] = []
+    list_subfields = field.list_subfields
+    subfield_template = field.subfield_template
+    attr = field.attribute
+    default = field.default
+    type_ = field.type_
+    preformatter = field.preformatter
+    postformatter = field.postformatter
+
+    for el in parent.css(field.selector):
+        if list_subfields:
+            obj: Dict[str, Any] = subfield_template.copy() if subfield_template is not None else {}
+            memo: Dict[str, Any] = {}
+            for subfield in list_subfields:
+                try:
+                    subel = css_first_memo(el, subfield.selector, memo)
+                except Exception as e:
+                    raise ParseError(f"Invalid sub-selector '{subfield.selector}' in list field '{field.name}': {e}")
+
+                subdefault = subfield.default
+                subval = subdefault
+                if subel:
+                    subval = subel.text() if not subfield.attribute else subel.attributes.get(subfield.attribute, subdefault)
+                    if subval != subdefault:
+                        subval = _apply_formatters(subval, subfield.preformatter, subfield.postformatter, subfield.type_, subdefault)
+                obj[subfield.name] = subval
+            values.append(obj)
+        else:
+            val = el.text() if not attr else el.attributes.get(attr, default)
+            if val != default:
+                val = _apply_formatters(val, preformatter, postformatter, type_, default)
+            values.append(val)
+
+    if field.list_formatter:
+        values = field.list_formatter(values)
+
+    return values
+
+
+def _apply_formatters(value, pre, post, type_, default):
+    if pre:
+        try:
+            value = pre(value)
+        except Exception as e:
+            raise FormatterError(f"Preformatter failed on value '{value}': {e}") from e
+    caster = CASTERS.get(type_)
+    if caster is not None:
+        try:
+            value = caster(value)
+        except Exception as e:
+            raise FormatterError(f"Failed to cast '{value}' to {type_}: {e}") from e
+    if post:
+        try:
+            value = post(value)
+        except Exception as e:
+            raise FormatterError(f"Postformatter failed on value '{value}': {e}") from e
+    return value
 
 
 class SyncHTTPCrawler:
@@ -19,170 +234,144 @@ class SyncHTTPCrawler:
     - supports attributes, default values, preformatter and postformatter callables
     - supports nested schemas via `url_follow_schema`
     - supports structured lists via `list_subfields` (list of objects)
+    - optional result cache (`cache_size`, `cache_ttl`), so fan-in follows are fetched once
+    - a page's distinct follows are fetched concurrently on up to `follow_workers` threads
     """
 
-    def __init__(self, session: Optional[aiohttp.ClientSession] = None) -> None:
-        self.session = session or requests.Session()
+    def __init__(
+        self,
+        session: Optional[aiohttp.ClientSession] = None,
+        cache_size: int = 0,
+        cache_ttl: Optional[float] = None,
+        follow_workers: int = 8
+    ) -> None:
+        self.session = session or pooled_session()
         self._close_session = False
-
-    def fetch(self, url: str, schema: HTTPCrawlerSchema, *args, **kwargs) -> List[Dict[str, Any]]:
-        pagination = schema.get("url_pagination", None)
+        # Records of the last `cache_size` (url, schema) fetches, optionally expiring after `cache_ttl` seconds
+        self._cache = ResultCache(cache_size, cache_ttl) if cache_size > 0 else None
+        # 1 fetches follows one after another, on the calling thread
+        self.follow_workers = follow_workers
+        # .in_follow is set on worker threads, whose own follows stay sequential
+        self._local = threading.local()
+
+    def fetch(
+        self,
+        url: str,
+        schema: HTTPCrawlerSchema,
+        *args,
+        cache: bool = True,
+        layout: Literal["rows", "columns"] = "rows",
+        **kwargs
+    ) -> Union[List[Dict[str, Any]], Dict[str, List[Any]]]:
+        """
+        Fetch `url` with `schema`. Pass `cache=False` to bypass the result cache for this URL (nested follows still use it).
+        `layout="columns"` returns one list per field (see `records_to_columns`) instead of one dict per record.
+        """
+        result_cache = self._cache if cache else None
+        request = request_key(args, kwargs) if result_cache is not None else None
+        records = result_cache.get(url, schema, request) if result_cache is not None else None
+        if records is None:
+            records = self._fetch(url, schema, *args, **kwargs)
+            if result_cache is not None:
+                result_cache.put(url, schema, records, request)
+        return records_to_columns(records) if layout == "columns" else records
+
+    def clear_cache(self) -> None:
+        """Drop all cached results."""
+        if self._cache is not None:
+            self._cache.clear()
+
+    def _fetch(self, url: str, schema: HTTPCrawlerSchema, *args, **kwargs) -> List[Dict[str, Any]]:
         on_pageload = schema.get("on_pageload")
-        
-        urls: List[str] = []
-
-        if pagination is None:
-            urls = [url]
-        else:
-            try:
-                start = pagination.get("start_page", 1)
-                end = pagination["end_page"]
-                placeholder = pagination.get("page_placeholder", "{page}")
-                urls = [url.replace(placeholder, str(i)) for i in range(start, end + 1)]
-            except Exception as e:
-                raise PaginationError(f"Invalid pagination schema: {e}")
+        if not callable(on_pageload):
+            on_pageload = None
+        urls = _pagination_urls(url, schema)
+        fields = compile_fields(schema.get("fields", []), _make_http_extractor)
 
         records: List[Dict[str, Any]] = []
+        # Records per page URL, so a repeated page (e.g. a url without the placeholder) is fetched once
+        pages: Dict[str, List[Dict[str, Any]]] = {}
+        # Follow results shared by all pages of this fetch: (url, id(follow schema)) -> records
+        followed: Dict[Tuple[str, int], List[Dict[str, Any]]] = {}
         for url in urls:
+            if url in pages:
+                # Repeats get their own record dicts, as if fetched again
+                records.extend(dict(record) for record in pages[url])
+                continue
             try:
                 response = self.session.get(url, *args, **kwargs)
                 response.raise_for_status()
                 
-                if on_pageload and callable(on_pageload):
+                if on_pageload is not None:
                     on_pageload(response)
                 
-            except requests.RequestException as e:
+            except _REQUEST_ERRORS as e:
                 raise RequestError(f"Failed to fetch {url}: {e}") from e
 
             try:
-                tree = HTMLParser(response.text)
+                tree = HTMLParser(response_markup(response))
             except Exception as e:
                 raise ParseError(f"Failed to parse HTML from {url}: {e}") from e
 
-            records.extend(self._extract_from_tree(tree, schema, *args, **kwargs))
+            page_records, pending = _extract_records(tree, schema, fields)
+            # Release this page's body and tree before follows (and later pages) download more
+            del tree, response
+            if pending:
+                self._resolve_follows(pending, followed, *args, **kwargs)
+            pages[url] = page_records
+            records.extend(page_records)
         return records
 
-    def _extract_from_tree(self, tree: HTMLParser, schema: HTTPCrawlerSchema, *args, **kwargs) -> List[Dict[str, Any]]:
-        try:
-            base_elements = tree.css(schema.get("base_selector", "body"))
-        except Exception as e:
-            raise ParseError(f"Invalid base_selector '{schema.get('base_selector')}', error: {e}")
-
-        fields: List[HTTPFieldSchema] = schema.get("fields", [])
-        records: List[Dict[str, Any]] = []
-
-        for parent in base_elements:
-            record: Dict[str, Any] = {}
-            for field in fields:
-                selector = field.get("selector")
-                attr = field.get("attribute")
-                default = field.get("default")
-                type_ = field.get("type", "text")
-                preformatter: Optional[Callable] = field.get("preformatter")
-                postformatter: Optional[Callable] = field.get("postformatter")
-                url_follow_schema = field.get("url_follow_schema")
-
-                if type_ == "list":
-                    record[field["name"]] = self._extract_list_field(parent, field)
-                    continue
-
-                try:
-                    el = parent.css_first(selector) if selector else None
-                except Exception as e:
-                    raise ParseError(f"Invalid selector '{selector}' in field '{field.get('name')}': {e}")
-
-                value = default
-                if el:
-                    value = el.text() if not attr else el.attributes.get(attr, default)
-                    value: Any = self._apply_formatters(value, preformatter, postformatter, type_, default)
+    def _resolve_follows(
+        self,
+        pending: List[tuple],
+        nested: Dict[Tuple[str, int], List[Dict[str, Any]]],
+        *args,
+        **kwargs
+    ) -> None:
+        """
+        Fetch the pending follows and merge them into their records. `nested` holds the
+        follows already fetched, (url, id(follow schema)) -> records, so each is fetched once.
+        Distinct follows download concurrently on a thread pool; follows found on those
+        threads are fetched sequentially there, so nesting doesn't multiply the threads.
+        """
+        todo = {key: target for key, target in follow_targets(pending).items() if key not in nested}
+
+        workers = min(len(todo), self.follow_workers)
+        if workers > 1 and not getattr(self._local, "in_follow", False):
+            pool = ThreadPoolExecutor(max_workers=workers)
+            try:
+                futures = {
+                    key: pool.submit(self._follow_in_worker, url, follow, *args, **kwargs)
+                    for key, (url, follow) in todo.items()
+                }
+                # Results are taken in discovery order, so the first failing follow is the one reported
+                for key, future in futures.items():
+                    nested[key] = future.result()
+            finally:
+                pool.shutdown(cancel_futures=True)
+        else:
+            for key, (url, follow) in todo.items():
+                nested[key] = self._follow(url, follow, *args, **kwargs)
 
-                if url_follow_schema and isinstance(value, str):
-                    try:
-                        nested = self.fetch(value, url_follow_schema, *args, **kwargs)
-                        if isinstance(nested, list):
-                            for item in nested:
-                                record.update(item)
-                        else:
-                            record.update(nested)
-                    except Exception as e:
-                        raise CrawlerError(f"Nested fetch failed for {value}: {e}") from e
-                else:
-                    record[field["name"]] = value
-            records.append(record)
-        return records
+        merge_follows(pending, nested)
 
-    def _extract_list_field(self, parent, field: HTTPFieldSchema):
-        values: List[Any] = []
-        selector = field["selector"]
-        attr = field.get("attribute")
-        default = field.get("default")
-        type_ = field.get("type", "text")
-        preformatter = field.get("preformatter")
-        postformatter = field.get("postformatter")
-        list_subfields = field.get("list_subfields")
-        list_formatter = field.get("list_formatter")
-
-        for el in parent.css(selector):
-            if list_subfields:
-                obj: Dict[str, Any] = {}
-                for subfield in list_subfields:
-                    try:
-                        subel = el.css_first(subfield["selector"])
-                    except Exception as e:
-                        raise ParseError(f"Invalid sub-selector '{subfield['selector']}' in list field '{field['name']}': {e}")
-
-                    subattr = subfield.get("attribute")
-                    subdefault = subfield.get("default")
-                    subtype = subfield.get("type", "text")
-                    sub_pre = subfield.get("preformatter")
-                    sub_post = subfield.get("postformatter")
-
-                    subval = subdefault
-                    if subel:
-                        subval = subel.text() if not subattr else subel.attributes.get(subattr, subdefault)
-                        if subval != subdefault:                
-                            subval = self._apply_formatters(subval, sub_pre, sub_post, subtype, subdefault)
-                    
-                    obj[subfield["name"]] = subval
-                values.append(obj)
-            else:
-                val = el.text() if not attr else el.attributes.get(attr, default)
-                if val != default:
-                    val = self._apply_formatters(val, preformatter, postformatter, type_, default)
-                values.append(val)
-        
-        if list_formatter and callable(list_formatter):
-            values = list_formatter(values)
-        
-        return values
-
-    def _apply_formatters(self, value, pre, post, type_, default):
-        if pre:
-            try:
-                value = pre(value)
-            except Exception as e:
-                raise FormatterError(f"Preformatter failed on value '{value}': {e}") from e
+    def _follow(self, url: str, follow: HTTPCrawlerSchema, *args, **kwargs) -> List[Dict[str, Any]]:
         try:
-            if type_ == "number":
-                value = float(value)
-                if value.is_integer():
-                    value = int(value)
-            elif type_ == "json":
-                value = json.loads(value)
-            elif type_ == "text":
-                value = str(value)
+            return self.fetch(url, follow, *args, **kwargs)
         except Exception as e:
-            raise FormatterError(f"Failed to cast '{value}' to {type_}: {e}") from e
-        if post:
-            try:
-                value = post(value)
-            except Exception as e:
-                raise FormatterError(f"Postformatter failed on value '{value}': {e}") from e
-        return value
+            raise CrawlerError(f"Nested fetch failed for {url}: {e}") from e
+
+    def _follow_in_worker(self, url: str, follow: HTTPCrawlerSchema, *args, **kwargs) -> List[Dict[str, Any]]:
+        self._local.in_follow = True
+        try:
+            return self._follow(url, follow, *args, **kwargs)
+        finally:
+            self._local.in_follow = False
 
     def __enter__(self):
         if self.session is None:
-            self.session = requests.Session()
+            self.session = pooled_session()
             self._close_session = True
         return self
 
@@ -202,24 +391,56 @@ class AsyncHTTPCrawler:
     - Structured lists via list_subfields
     - Pagination support
     - Optional external session reuse
-    - Concurrency limit via semaphore
+    - Concurrency limit via semaphore, matched by the per-host connection limit,
+      or adapting to the host with `concurrency=ConcurrencySettings(...)`
+    - Optional result cache (`cache_size`, `cache_ttl`)
+    - Certificate verification, unless `verify_ssl=False`
     """
 
     def __init__(
         self,
         session: Optional[aiohttp.ClientSession] = None,
         max_concurrency: int = 10,
-        timeout: int = 20
+        timeout: int = 20,
+        cache_size: int = 0,
+        cache_ttl: Optional[float] = None,
+        verify_ssl: bool = True,
+        concurrency: Optional[ConcurrencySettings] = None,
     ) -> None:
         self.external_session = session
         self.session: Optional[aiohttp.ClientSession] = session
-        self.semaphore = asyncio.Semaphore(max_concurrency)
+        self.verify_ssl = verify_ssl
+        if concurrency is None:
+            self.max_concurrency = max_concurrency
+            self.semaphore = asyncio.Semaphore(max_concurrency)
+        else:
+            # Adaptive limit instead of a fixed one; max_concurrency is then ignored
+            self.max_concurrency = concurrency.max_concurrency
+            self.semaphore = AdaptiveLimiter(concurrency, (asyncio.TimeoutError, aiohttp.ClientConnectionError))
         self.timeout = aiohttp.ClientTimeout(total=timeout)
+        # Records of the last `cache_size` (url, schema) fetches, optionally expiring after `cache_ttl` seconds
+        self._cache = ResultCache(cache_size, cache_ttl) if cache_size > 0 else None
+        # (url, id(follow schema), request_key(...)) -> nested fetch currently running for it
+        self._inflight: Dict[Tuple[str, int, tuple], asyncio.Future] = {}
+
+    def _new_session(self) -> aiohttp.ClientSession:
+        # As many connections per host as requests may be in flight, with room for more
+        # hosts when url_follow_schema fans out. Idle connections are kept for reuse across
+        # pages; resolved addresses are cached for 5 minutes, looked up with aiodns when installed.
+        connector = aiohttp.TCPConnector(
+            limit=max(100, self.max_concurrency * 2),
+            limit_per_host=self.max_concurrency,
+            keepalive_timeout=60,
+            ttl_dns_cache=300,
+            use_dns_cache=True,
+            resolver=aiohttp.AsyncResolver() if aiodns is not None else None,
+            ssl=self.verify_ssl,
+        )
+        return aiohttp.ClientSession(connector=connector, timeout=self.timeout)
 
     async def _get_session(self) -> aiohttp.ClientSession:
         if self.session is None or self.session.closed:
-            connector = aiohttp.TCPConnector(limit_per_host=10, ssl=False)
-            self.session = aiohttp.ClientSession(connector=connector, timeout=self.timeout)
+            self.session = self._new_session()
         return self.session
 
     async def close(self):
@@ -227,176 +448,178 @@ class AsyncHTTPCrawler:
         if self.session and not self.session.closed and not self.external_session:
             await self.session.close()
 
-    async def fetch(self, url: str, schema: HTTPCrawlerSchema, *args, **kwargs) -> List[Dict[str, Any]]:
-        """Fetch data from a URL or paginated URLs using the provided schema."""
-        pagination = schema.get("url_pagination")
-        urls: List[str] = []
-
-        if pagination is None:
-            urls = [url]
-        else:
-            try:
-                start = pagination.get("start_page", 1)
-                end = pagination["end_page"]
-                placeholder = pagination.get("page_placeholder", "{page}")
-                urls = [url.replace(placeholder, str(i)) for i in range(start, end + 1)]
-            except Exception as e:
-                raise PaginationError(f"Invalid pagination schema: {e}")
-
-
-        tasks = [self._fetch_page(u, schema, *args, **kwargs) for u in urls]
+    async def fetch(
+        self,
+        url: str,
+        schema: HTTPCrawlerSchema,
+        *args,
+        cache: bool = True,
+        layout: Literal["rows", "columns"] = "rows",
+        **kwargs
+    ) -> Union[List[Dict[str, Any]], Dict[str, List[Any]]]:
+        """
+        Fetch data from a URL or paginated URLs using the provided schema.
+        Pass `cache=False` to bypass the result cache for this URL (nested follows still use it,
+        but don't join follows other fetch calls have in flight).
+        `layout="columns"` returns one list per field (see `records_to_columns`) instead of one dict per record.
+        """
+        result_cache = self._cache if cache else None
+        request = request_key(args, kwargs) if result_cache is not None else None
+        records = result_cache.get(url, schema, request) if result_cache is not None else None
+        if records is None:
+            records = await self._fetch(url, schema, cache, *args, **kwargs)
+            if result_cache is not None:
+                result_cache.put(url, schema, records, request)
+        return records_to_columns(records) if layout == "columns" else records
+
+    async def _fetch(self, url: str, schema: HTTPCrawlerSchema, shared: bool, *args, **kwargs) -> List[Dict[str, Any]]:
+        urls = _pagination_urls(url, schema)
+
+        # Repeated page URLs (e.g. a url without the placeholder) are fetched once
+        unique = list(dict.fromkeys(urls))
+        # Follows shared by all pages of this fetch: (url, id(follow schema)) -> its fetch
+        followed: Dict[Tuple[str, int], asyncio.Future] = {}
+        tasks = [self._fetch_page(u, schema, followed, shared, *args, **kwargs) for u in unique]
 
         try:
             results = await asyncio.gather(*tasks)
         except Exception as e:
             raise RequestError(f"Async fetch failed: {e}") from e
 
-        return [r for sublist in results for r in sublist]
+        pages = dict(zip(unique, results))
+        records: List[Dict[str, Any]] = []
+        seen = set()
+        for u in urls:
+            # Repeats get their own record dicts, as if fetched again
+            records.extend([dict(r) for r in pages[u]] if u in seen else pages[u])
+            seen.add(u)
+        return records
+
+    async def fetch_incremental(self, url: str, schema: HTTPCrawlerSchema, *args, **kwargs) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Like `fetch`, but yields each page's records as soon as that page is done, in completion
+        order rather than page order. Consumers can start after the first page, and finished
+        pages don't wait in memory for the slowest one. The result cache is not used.
+        """
+        urls = _pagination_urls(url, schema)
+        counts: Dict[str, int] = {}
+        for u in urls:
+            counts[u] = counts.get(u, 0) + 1
+
+        followed: Dict[Tuple[str, int], asyncio.Future] = {}
 
-    async def _fetch_page(self, url: str, schema: HTTPCrawlerSchema, *args, **kwargs) -> List[Dict[str, Any]]:
+        async def page(u: str) -> Tuple[str, List[Dict[str, Any]]]:
+            return u, await self._fetch_page(u, schema, followed, True, *args, **kwargs)
+
+        # Repeated page URLs are fetched once, like in fetch()
+        tasks = [asyncio.ensure_future(page(u)) for u in counts]
+        try:
+            for done in asyncio.as_completed(tasks):
+                try:
+                    u, records = await done
+                except Exception as e:
+                    raise RequestError(f"Async fetch failed: {e}") from e
+                for record in records:
+                    yield record
+                for _ in range(counts[u] - 1):
+                    for record in records:
+                        yield dict(record)
+        finally:
+            # The consumer stopped early or a page failed: don't leave pages downloading
+            for task in tasks:
+                task.cancel()
+
+    def clear_cache(self) -> None:
+        """Drop all cached results."""
+        if self._cache is not None:
+            self._cache.clear()
+
+    async def _fetch_page(
+        self,
+        url: str,
+        schema: HTTPCrawlerSchema,
+        followed: Dict[Tuple[str, int], asyncio.Future],
+        shared: bool,
+        *args,
+        **kwargs
+    ) -> List[Dict[str, Any]]:
         on_pageload = schema.get("on_pageload")
-        
+        if not callable(on_pageload):
+            on_pageload = None
+
         async with self.semaphore:
             session = await self._get_session()
             try:
                 async with session.get(url, *args, **kwargs) as resp:
                     resp.raise_for_status()
-                    
-                    if on_pageload and callable(on_pageload):
-                        on_pageload(resp)
-                    
-                    html = await resp.text()
+                    html = await aiohttp_markup(resp)
             except aiohttp.ClientError as e:
                 raise RequestError(f"Failed to fetch {url}: {e}") from e
 
-            try:
-                tree = HTMLParser(html)
-            except Exception as e:
-                raise ParseError(f"Failed to parse HTML from {url}: {e}") from e
-
-            return await self._extract_from_tree(tree, schema, *args, **kwargs)
+        # Called once the body is read and the slot released, so a slow callback holds neither
+        # a pooled connection nor a concurrency slot. The read body stays available on `resp`.
+        if on_pageload is not None:
+            result = on_pageload(resp)
+            if inspect.isawaitable(result):
+                await result
+
+        # Compiled here, on the event loop, so worker threads only read the compiled fields
+        fields = compile_fields(schema.get("fields", []), _make_http_extractor)
+        # Parsing and extraction are CPU-bound: run them in the loop's default executor so
+        # other pages keep downloading meanwhile. Outside the semaphore, since nested
+        # follows acquire it themselves.
+        loop = asyncio.get_running_loop()
+        records, pending = await loop.run_in_executor(None, self._parse_and_extract, url, html, schema, fields)
+        # Nothing references the page body or its tree any more; don't hold it through the
+        # follows. The response keeps its own copy of the body, so it goes too.
+        del html, resp
+
+        if pending:
+            # Each distinct (url, schema) is fetched once, however many records point at it
+            unique = follow_targets(pending)
+            fetched = await asyncio.gather(*(self._follow(u, follow, followed, shared, *args, **kwargs) for u, follow in unique.values()))
+            merge_follows(pending, dict(zip(unique, fetched)))
+        return records
 
-    async def _extract_from_tree(self, tree: HTMLParser, schema: HTTPCrawlerSchema, *args, **kwargs) -> List[Dict[str, Any]]:
+    def _parse_and_extract(self, url: str, html, schema: HTTPCrawlerSchema, fields: Tuple[CompiledField, ...]) -> Tuple[List[Dict[str, Any]], List[tuple]]:
         try:
-            base_elements = tree.css(schema.get("base_selector", "body"))
+            tree = HTMLParser(html)
         except Exception as e:
-            raise ParseError(f"Invalid base_selector '{schema.get('base_selector')}', error: {e}")
-
-        fields: List[HTTPFieldSchema] = schema.get("fields", [])
-        records: List[Dict[str, Any]] = []
-
-        for parent in base_elements:
-            record: Dict[str, Any] = {}
-            for field in fields:
-                selector = field.get("selector")
-                attr = field.get("attribute")
-                default = field.get("default")
-                type_ = field.get("type", "text")
-                preformatter: Optional[Callable] = field.get("preformatter")
-                postformatter: Optional[Callable] = field.get("postformatter")
-                url_follow_schema = field.get("url_follow_schema")
-
-                if type_ == "list":
-                    record[field["name"]] = await self._extract_list_field(parent, field, *args, **kwargs)
-                    continue
+            raise ParseError(f"Failed to parse HTML from {url}: {e}") from e
+        return _extract_records(tree, schema, fields)
 
-                try:
-                    el = parent.css_first(selector) if selector else None
-                except Exception as e:
-                    raise ParseError(f"Invalid selector '{selector}' in field '{field.get('name')}': {e}")
-
-                value = default
-                if el:
-                    value = el.attributes.get(field.get("attribute"), value) if "attribute" in field else el.text()
-                    value = self._apply_formatters(value, preformatter, postformatter, type_, default)
-
-                if url_follow_schema and isinstance(value, str):
-                    try:
-                        nested = await self.fetch(value, url_follow_schema, *args, **kwargs)
-                        if isinstance(nested, list):
-                            for item in nested:
-                                record.update(item)
-                        else:
-                            record.update(nested)
-                    except Exception as e:
-                        raise CrawlerError(f"Nested async fetch failed for {value}: {e}") from e
-                else:
-                    record[field["name"]] = value
-
-            records.append(record)
-        return records
-
-    async def _extract_list_field(self, parent, field: HTTPFieldSchema, *args, **kwargs) -> List[Any]:
-        values: List[Any] = []
-        selector = field.get("selector")
-        attr = field.get("attribute")
-        default = field.get("default")
-        type_ = field.get("type", "text")
-        preformatter = field.get("preformatter")
-        postformatter = field.get("postformatter")
-        list_subfields = field.get("list_subfields")
-        list_formatter = field.get("list_formatter")
-
-        for el in parent.css(selector):
-            if list_subfields:
-                obj: Dict[str, Any] = {}
-                for subfield in list_subfields:
-                    try:
-                        subel = el.css_first(subfield["selector"])
-                    except Exception as e:
-                        raise ParseError(f"Invalid sub-selector '{subfield['selector']}' in list field '{field['name']}': {e}")
-
-                    subattr = subfield.get("attribute")
-                    subdefault = subfield.get("default")
-                    subtype = subfield.get("type", "text")
-                    sub_pre = subfield.get("preformatter")
-                    sub_post = subfield.get("postformatter")
-
-                    subval = subdefault
-                    if subel:
-                        subval = subel.text() if not subattr else subel.attributes.get(subattr, subdefault)
-                        if subval != subdefault:
-                            subval = self._apply_formatters(subval, sub_pre, sub_post, subtype, subdefault)
-                    obj[subfield["name"]] = subval
-                values.append(obj)
-            else:
-                val = el.text() if not attr else el.attributes.get(attr, default)
-                if val != default:
-                    val = self._apply_formatters(val, preformatter, postformatter, type_, default)
-                values.append(val)
-                
-        if list_formatter and callable(list_formatter):
-            values = list_formatter(values)
-        
-        return values
-
-    def _apply_formatters(self, value, pre, post, type_, default):
-        if pre:
-            try:
-                value = pre(value)
-            except Exception as e:
-                raise FormatterError(f"Preformatter failed on value '{value}': {e}") from e
+    async def _follow(
+        self,
+        url: str,
+        schema: HTTPCrawlerSchema,
+        followed: Dict[Tuple[str, int], asyncio.Future],
+        shared: bool,
+        *args,
+        **kwargs
+    ) -> List[Dict[str, Any]]:
+        # Follows of the same (url, schema) share one fetch: from any page of the same fetch
+        # via `followed`, even once finished, and, when `shared`, from concurrent fetch calls
+        # making the same request while in flight. Callers only merge the returned records
+        # into their own, so sharing them is safe.
+        task = followed.get((url, id(schema)))
+        if task is None:
+            key = (url, id(schema), request_key(args, kwargs))
+            task = self._inflight.get(key) if shared else None
+            if task is None:
+                task = asyncio.ensure_future(self.fetch(url, schema, *args, **kwargs))
+                if shared:
+                    self._inflight[key] = task
+                    task.add_done_callback(lambda _: self._inflight.pop(key, None))
+            followed[(url, id(schema))] = task
         try:
-            if type_ == "number":
-                value = float(value)
-                if value.is_integer():
-                    value = int(value)
-            elif type_ == "json":
-                value = json.loads(value)
-            elif type_ == "text":
-                value = str(value)
+            # Shielded: one cancelled caller mustn't cancel the fetch for the others
+            return await asyncio.shield(task)
         except Exception as e:
-            raise FormatterError(f"Failed to cast '{value}' to {type_}: {e}") from e
-        if post:
-            try:
-                value = post(value)
-            except Exception as e:
-                raise FormatterError(f"Postformatter failed on value '{value}': {e}") from e
-        return value
+            raise CrawlerError(f"Nested async fetch failed for {url}: {e}") from e
 
     async def __aenter__(self):
         if self.session is None:
-            self.session = aiohttp.ClientSession()
+            self.session = self._new_session()
             self._close_session = True
         return self
 
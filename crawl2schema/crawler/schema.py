@@ -17,6 +17,10 @@ class BaseFieldSchema(Generic[T], TypedDict, total=True):
     type: Literal["text", "list", "number", "json", "undefined"]
     attribute: str
     default: Any
+    # Collapse whitespace runs to single spaces and strip, before the preformatter
+    normalize_whitespace: bool
+    # Regex searched in the raw value, which becomes its first group (or the whole match)
+    pattern: str
     
     preformatter: Callable[[Any], Any]
     postformatter: Callable[[Any], Any]
@@ -48,6 +52,7 @@ class URLPaginationSchema(TypedDict, total=False):
 class ScrollPaginationSchema(TypedDict, total=False):
     stop_condition: Literal["count", "element", "no-new-elements"]
     scroll_distance: int
+    # Upper bound in seconds; the wait ends early once new base_selector items appear
     scroll_delay: float
     scroll_selector: str
     scroll_horizontal: bool
@@ -72,6 +77,7 @@ class ButtonPaginationSchema(TypedDict, total=False):
     # Scroll-like options (optional)
     scroll_distance: int
     scroll_selector: str
+    # Upper bound in seconds after each scroll/click; ends early once new base_selector items appear
     cycle_delay: float
     scroll_horizontal: bool
     
@@ -80,6 +86,7 @@ class ButtonPaginationSchema(TypedDict, total=False):
     stop_selector: str
     
     # Retry options for scroll
+    # Upper bound in seconds to wait for a missing button; ends early once it is visible
     retry_delay: float
     retry_limit: int
     retry_scroll_distance: int
@@ -100,6 +107,8 @@ class HTTPCrawlerSchema(BaseCrawlerSchema, total=True):
     """
     fields: List[HTTPFieldSchema]
     url_pagination: URLPaginationSchema
+    # Called with each page's response once its body is read. AsyncHTTPCrawler passes the
+    # aiohttp response and awaits the result if it is awaitable.
     on_pageload: Callable[[Response], None]
 
 
@@ -114,7 +123,19 @@ class BrowserCrawlerSchema(BaseCrawlerSchema, total=True):
     Schema for browser-based crawlers (Playwright, Selenium, etc.)
     Supports both scroll and URL pagination.
     """
+    # Without a `selector`, the options (e.g. `timeout`) apply to the default
+    # wait for base_selector, whose timeout otherwise follows goto()'s.
     wait_for_selector: WaitForSelectorArgs
+    # Try a plain HTTP request first and only render in the browser when
+    # base_selector has no matches in the raw HTML.
+    prefer_http: bool
+    # Extract fields with one in-page querySelector pass instead of
+    # serializing the DOM for selectolax (default False). Schemas with
+    # url_follow_schema always parse with selectolax.
+    extract_in_browser: bool
+    # Abort image, font, media and stylesheet requests. Visibility-based
+    # checks (button pagination) may behave differently without CSS.
+    block_resources: bool
     
     scroll_pagination: ScrollPaginationSchema
     button_pagination: ButtonPaginationSchema
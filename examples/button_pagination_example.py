@@ -22,6 +22,6 @@ schema: BrowserCrawlerSchema = {
 }
 
 url = "https://web-scraping.dev/reviews"
-data = crawler.fetch(url, schema=schema, wait_until="networkidle")
+data = crawler.fetch(url, schema=schema)
 pprint(data)
 pprint(len(data))
\ No newline at end of file
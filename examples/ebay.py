@@ -4,6 +4,7 @@ from pprint import pprint
 import re
 from playwright.sync_api import sync_playwright
 
+_PRICE_RE = re.compile(r"^\$(\d*\.\d*)$")
 
 # helper functions
 def clean_text(text: str) -> str:
@@ -11,7 +12,7 @@ def clean_text(text: str) -> str:
 
 def price_to_number(price: str) -> int | float:
     price = price.replace(",", "").strip()
-    return re.match(r"^\$(\d*\.\d*)$", price).group(1)
+    return _PRICE_RE.match(price).group(1)
 
 p = sync_playwright().start()
 browser = p.chromium.launch(headless=False)
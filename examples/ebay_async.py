@@ -0,0 +1,42 @@
+from crawl2schema.crawler.browser import AsyncBrowserCrawler, AsyncBrowserPool
+from crawl2schema.crawler.schema import AsyncBrowserCrawlerSchema
+from pprint import pprint
+import asyncio
+import re
+
+_PRICE_RE = re.compile(r"^\$(\d*\.\d*)$")
+
+# helper functions
+def clean_text(text: str) -> str:
+    return text.replace("\n", " ").strip()
+
+def price_to_number(price: str) -> int | float:
+    price = price.replace(",", "").strip()
+    return _PRICE_RE.match(price).group(1)
+
+schema: AsyncBrowserCrawlerSchema = {
+    "base_selector": "li.s-card[id^=item]",
+    "fields": [
+        { "name": "title", "selector": "span.primary.default", "type": "text", "postformatter": clean_text },
+        { "name": "price", "selector": "span.s-card__price", "type": "number", "preformatter": price_to_number},
+        { "name": "owner", "selector": "div.su-card-container__attributes__secondary > div > span", "type": "text" },
+        { "name": "image", "selector": "img", "type": "text", "attribute": "src"},
+        { "name": "url", "selector": "a", "type": "text", "attribute": "href" }
+    ],
+    "url_pagination": {
+        "end_page": 20
+    },
+    "wait_for_selector": { "selector": "li.s-card[id^=item]"}
+}
+
+async def main():
+    # The 20 pages load 4 at a time, each on its own page of one shared context;
+    # the pool keeps Chromium warm for any further crawlers
+    async with AsyncBrowserPool(headless=False) as pool:
+        async with AsyncBrowserCrawler(pool=pool, max_concurrency=4) as crawler:
+            data = await crawler.fetch("https://www.ebay.com/sch/i.html?_nkw=bicycle&_pgn={page}", schema=schema)
+
+    pprint(data)
+    pprint(len(data))
+
+asyncio.run(main())
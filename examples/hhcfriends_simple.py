@@ -3,17 +3,21 @@ from crawl2schema.crawler.schema import BrowserCrawlerSchema
 from pprint import pprint
 import re
 
+_RATING_RE = re.compile(r"^(\d\.\d{1,2}) stars$")
+
 def clean_text(text):
     return text.replace("\n", " ").strip()
 
 def price_to_number(text):
-    text = clean_text(text)
-    return re.sub(".*€", "", text.replace(",", "."))
+    text = clean_text(text).replace(",", ".")
+    # Everything after the last euro sign, if any
+    _, sep, amount = text.rpartition("€")
+    return amount if sep else text
 
 def rating_to_number(text):
     text = clean_text(text)
 
-    return re.match(r"^(\d\.\d{1,2}) stars$", text).group(1)
+    return _RATING_RE.match(text).group(1)
 
 crawler = SyncBrowserCrawler()
 schema: BrowserCrawlerSchema = {
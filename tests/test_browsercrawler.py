@@ -0,0 +1,186 @@
+import asyncio
+import threading
+import time
+from crawl2schema.crawler.browser import AsyncBrowserCrawler, AsyncBrowserPool, SyncBrowserCrawler, _BrowserPool, _base_selector_wait_args
+from crawl2schema.crawler.concurrency import ConcurrencySettings
+from crawl2schema.crawler.schema import AsyncBrowserCrawlerSchema, SyncBrowserCrawlerSchema
+from util import as_new_section_sync, chromium, serve_pages
+
+
+# Offline browser tests, against pages served from this process
+
+STORAGE_PAGE = """
+<html><body>
+  <div class="item"><span class="seen"></span></div>
+  <script>
+    document.querySelector(".seen").textContent = localStorage.getItem("seen") || "fresh";
+    localStorage.setItem("seen", "stale");
+  </script>
+</body></html>
+"""
+
+SEEN_SCHEMA: SyncBrowserCrawlerSchema = {
+    "base_selector": "div.item",
+    "fields": [{"name": "seen", "type": "text", "selector": "span.seen"}],
+}
+
+ITEMS_PAGE = """
+<html><body>
+  <div class="item"><a href="/product/12">  Widget
+     twelve </a><span class="price">1.50</span><li>red</li><li>blue</li></div>
+  <div class="item"><a>Widget without link</a><span class="price">2</span></div>
+</body></html>
+"""
+
+ITEMS_SCHEMA: SyncBrowserCrawlerSchema = {
+    "base_selector": "div.item",
+    "fields": [
+        {"name": "title", "type": "text", "selector": "a", "normalize_whitespace": True},
+        {"name": "id", "type": "text", "selector": "a", "attribute": "href", "pattern": r"/product/(\d+)", "default": None},
+        {"name": "price", "type": "number", "selector": "span.price"},
+        {"name": "colours", "type": "list", "selector": "li"},
+    ],
+}
+
+
+@chromium
+@as_new_section_sync
+def test_pooled_contexts_are_fresh():
+    with serve_pages({"/": STORAGE_PAGE}) as base:
+        for _ in range(2):
+            crawler = SyncBrowserCrawler()
+            try:
+                assert crawler.fetch(base + "/", SEEN_SCHEMA) == [{"seen": "fresh"}]
+            finally:
+                crawler.close()
+
+
+@chromium
+@as_new_section_sync
+def test_worker_thread_pool_stops():
+    results = []
+
+    def crawl(base):
+        crawler = SyncBrowserCrawler()
+        try:
+            results.append(crawler.fetch(base + "/", SEEN_SCHEMA))
+        finally:
+            crawler.close()
+        # The last crawler of a worker thread stops that thread's driver
+        results.append(_BrowserPool._local.pool)
+
+    with serve_pages({"/": STORAGE_PAGE}) as base:
+        worker = threading.Thread(target=crawl, args=(base,))
+        worker.start()
+        worker.join()
+    assert results == [[{"seen": "fresh"}], None]
+
+
+@chromium
+@as_new_section_sync
+def test_in_browser_extraction_matches_selectolax():
+    crawler = SyncBrowserCrawler()
+    try:
+        with serve_pages({"/": ITEMS_PAGE}) as base:
+            parsed = crawler.fetch(base + "/", ITEMS_SCHEMA)
+            in_browser = crawler.fetch(base + "/", {**ITEMS_SCHEMA, "extract_in_browser": True})
+    finally:
+        crawler.close()
+    assert parsed[0]["id"] == "12" and parsed[1]["id"] is None
+    assert in_browser == parsed
+
+
+@chromium
+@as_new_section_sync
+def test_url_pagination_order():
+    pages = {f"/page/{i}": f'<div class="item"><span class="seen">{i}</span></div>' for i in range(1, 6)}
+    hits = []
+    schema: SyncBrowserCrawlerSchema = {
+        **SEEN_SCHEMA,
+        "url_pagination": {"start_page": 1, "end_page": 5, "page_placeholder": "{page}"},
+    }
+    crawler = SyncBrowserCrawler()
+    try:
+        with serve_pages(pages, hits) as base:
+            records = crawler.fetch(base + "/page/{page}", schema, referer=base + "/")
+    finally:
+        crawler.close()
+    assert records == [{"seen": str(i)} for i in range(1, 6)]
+    assert [hit for hit in hits if hit.startswith("/page/")] == [f"/page/{i}" for i in range(1, 6)]
+
+
+@as_new_section_sync
+def test_base_selector_wait_timeout():
+    assert _base_selector_wait_args(SEEN_SCHEMA, {}) == {"timeout": 15000}
+    assert _base_selector_wait_args(SEEN_SCHEMA, {"timeout": 60000}) == {"timeout": 60000}
+    schema: SyncBrowserCrawlerSchema = {**SEEN_SCHEMA, "wait_for_selector": {"timeout": 500, "state": "visible"}}
+    assert _base_selector_wait_args(schema, {"timeout": 60000}) == {"timeout": 500, "state": "visible"}
+
+
+@chromium
+@as_new_section_sync
+def test_base_selector_wait_gives_up():
+    schema: SyncBrowserCrawlerSchema = {**SEEN_SCHEMA, "wait_for_selector": {"timeout": 200}}
+    crawler = SyncBrowserCrawler()
+    try:
+        with serve_pages({"/": "<html><body>No items</body></html>"}) as base:
+            started = time.monotonic()
+            assert crawler.fetch(base + "/", schema) == []
+            assert time.monotonic() - started < 5
+    finally:
+        crawler.close()
+
+
+SCROLL_PAGE = """
+<html><body style="height: 5000px">
+  <div class="item"><span class="seen">1</span></div>
+  <script>
+    let n = 1;
+    addEventListener("scroll", () => {
+      if (n >= 3) return;
+      n += 1;
+      setTimeout(() => document.body.insertAdjacentHTML("beforeend", `<div class="item"><span class="seen">${n}</span></div>`), 50);
+    });
+  </script>
+</body></html>
+"""
+
+
+@chromium
+@as_new_section_sync
+def test_scroll_pagination_waits_for_items():
+    schema: SyncBrowserCrawlerSchema = {
+        **SEEN_SCHEMA,
+        "scroll_pagination": {"stop_condition": "count", "scroll_count": 2, "scroll_distance": 500, "scroll_delay": 5},
+    }
+    crawler = SyncBrowserCrawler()
+    try:
+        with serve_pages({"/": SCROLL_PAGE}) as base:
+            started = time.monotonic()
+            records = crawler.fetch(base + "/", schema)
+            # Each wait ends as soon as the new item is attached, well before scroll_delay
+            assert time.monotonic() - started < 5
+    finally:
+        crawler.close()
+    assert records == [{"seen": str(i)} for i in range(1, 4)]
+
+
+@chromium
+@as_new_section_sync
+def test_async_url_pagination_concurrency():
+    pages = {f"/page/{i}": f'<div class="item"><span class="seen">{i}</span></div>' for i in range(1, 9)}
+    schema: AsyncBrowserCrawlerSchema = {
+        **SEEN_SCHEMA,
+        "url_pagination": {"start_page": 1, "end_page": 8, "page_placeholder": "{page}"},
+    }
+    expected = [{"seen": str(i)} for i in range(1, 9)]
+
+    async def crawl(base):
+        async with AsyncBrowserPool() as pool:
+            # The fixed semaphore default, then the adaptive limiter
+            for concurrency in (None, ConcurrencySettings(min_concurrency=1, max_concurrency=4, desired_concurrency=2)):
+                async with AsyncBrowserCrawler(pool=pool, concurrency=concurrency) as crawler:
+                    assert await crawler.fetch(base + "/page/{page}", schema) == expected
+
+    with serve_pages(pages, delay=0.05) as base:
+        asyncio.run(crawl(base))
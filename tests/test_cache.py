@@ -0,0 +1,58 @@
+import time
+from crawl2schema.crawler.cache import ResultCache
+from util import as_new_section_sync
+
+
+schema = {"base_selector": "div", "fields": []}
+other_schema = {"base_selector": "div", "fields": []}
+
+
+@as_new_section_sync
+def test_get_put():
+    cache = ResultCache(maxsize=4)
+    assert cache.get("a", schema) is None
+
+    records = [{"name": "a"}]
+    cache.put("a", schema, records)
+    assert cache.get("a", schema) == records
+    # Keyed by schema identity, not equality
+    assert cache.get("a", other_schema) is None
+
+    # Callers get copies; editing them or the stored records doesn't reach the cache
+    cache.get("a", schema)[0]["name"] = "edited"
+    records[0]["name"] = "edited"
+    assert cache.get("a", schema) == [{"name": "a"}]
+
+
+@as_new_section_sync
+def test_lru_eviction():
+    cache = ResultCache(maxsize=2)
+    cache.put("a", schema, [{"page": "a"}])
+    cache.put("b", schema, [{"page": "b"}])
+    # Reading "a" makes "b" the least recently used
+    assert cache.get("a", schema) is not None
+    cache.put("c", schema, [{"page": "c"}])
+
+    assert len(cache) == 2
+    assert cache.get("b", schema) is None
+    assert cache.get("a", schema) == [{"page": "a"}]
+    assert cache.get("c", schema) == [{"page": "c"}]
+
+
+@as_new_section_sync
+def test_ttl():
+    cache = ResultCache(maxsize=4, ttl=0.05)
+    cache.put("a", schema, [{"page": "a"}])
+    assert cache.get("a", schema) == [{"page": "a"}]
+    time.sleep(0.1)
+    assert cache.get("a", schema) is None
+    assert len(cache) == 0
+
+
+@as_new_section_sync
+def test_clear():
+    cache = ResultCache()
+    cache.put("a", schema, [])
+    cache.clear()
+    assert len(cache) == 0
+    assert cache.get("a", schema) is None
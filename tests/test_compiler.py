@@ -0,0 +1,124 @@
+import pytest
+from concurrent.futures import ThreadPoolExecutor
+from crawl2schema.crawler.http import HTMLParser
+from crawl2schema.crawler.compiler import (
+    compile_fields,
+    normalize_whitespace,
+    prefetch_first_matches,
+    records_to_columns,
+)
+from crawl2schema.exceptions import CrawlerError, InvalidSchema
+from util import as_new_section_sync
+
+
+def extract(html: str, field: dict):
+    compiled = compile_fields([field])[0]
+    return compiled.extract(HTMLParser(html).css_first("body"), {})
+
+
+@as_new_section_sync
+def test_normalize_whitespace():
+    assert normalize_whitespace("  Product \n\t  one  ") == "Product one"
+    assert normalize_whitespace("") == ""
+    # Non-strings, such as a missing attribute's default, pass through
+    assert normalize_whitespace(None) is None
+    assert normalize_whitespace(3) == 3
+
+    field = {"name": "name", "type": "text", "selector": "h3", "normalize_whitespace": True}
+    assert extract("<h3>\n   Box  of\n chocolate  </h3>", field) == "Box of chocolate"
+
+
+@as_new_section_sync
+def test_pattern():
+    html = "<span>Price: € 12.50 (incl. VAT)</span>"
+    grouped = {"name": "price", "type": "number", "selector": "span", "pattern": r"€\s*([\d.]+)"}
+    assert extract(html, grouped) == 12.5
+    whole = {"name": "price", "type": "text", "selector": "span", "pattern": r"[\d.]+"}
+    assert extract(html, whole) == "12.50"
+
+    # Runs after whitespace normalization, before the preformatter
+    chained = {"name": "vat", "type": "text", "selector": "span", "normalize_whitespace": True,
+               "pattern": r"\((.*)\)", "preformatter": str.upper}
+    assert extract("<span>x  (incl.\n VAT)</span>", chained) == "INCL. VAT"
+
+    with pytest.raises(CrawlerError):
+        extract("<span>no price</span>", grouped)
+    with pytest.raises(InvalidSchema):
+        compile_fields([{"name": "bad", "selector": "span", "pattern": "("}])
+
+
+@as_new_section_sync
+def test_records_to_columns():
+    assert records_to_columns([]) == {}
+    assert records_to_columns([{"a": 1, "b": 2}, {"a": 3, "b": 4}]) == {"a": [1, 3], "b": [2, 4]}
+    # Records with different keys (e.g. follows that matched nothing) are padded with None
+    assert records_to_columns([{"a": 1}, {"a": 2, "b": 3}, {"b": 4, "c": 5}]) == {
+        "a": [1, 2, None],
+        "b": [None, 3, 4],
+        "c": [None, None, 5],
+    }
+
+
+PRODUCTS = "".join(
+    f"""
+    <div class="product" id="p{i}">
+      <h3 class="title"><a href="/product/{i}">Product {i}</a></h3>
+      {'<span class="price">' + str(i) + '</span>' if i % 3 else ''}
+      <p>first {i}</p><p>second {i}</p>
+    </div>
+    """
+    for i in range(40)
+)
+
+FIELDS = [
+    {"name": "title", "type": "text", "selector": "a"},
+    {"name": "href", "type": "text", "selector": "a", "attribute": "href"},
+    {"name": "price", "type": "number", "selector": "span.price"},
+    {"name": "description", "type": "text", "selector": "p"},
+    # The parent itself matches, as css_first includes it
+    {"name": "id", "type": "text", "selector": "div.product", "attribute": "id"},
+    # Combinators are left to per-parent css_first
+    {"name": "heading", "type": "text", "selector": "h3 > a"},
+]
+
+
+@as_new_section_sync
+def test_prefetch_first_matches():
+    tree = HTMLParser(f"<body>{PRODUCTS}</body>")
+    parents = tree.css("div.product")
+    fields = compile_fields(FIELDS)
+    memos = prefetch_first_matches(tree, "div.product", parents, fields)
+    assert memos is not None
+
+    for parent, memo in zip(parents, memos):
+        assert "h3 > a" not in memo
+        for selector, node in memo.items():
+            expected = parent.css_first(selector)
+            if expected is None:
+                assert node is None
+            else:
+                assert node is not None and node.mem_id == expected.mem_id
+
+
+@as_new_section_sync
+def test_prefetch_first_matches_declines():
+    fields = compile_fields(FIELDS)
+
+    few = HTMLParser("<body><div class='product'><a>one</a></div></body>")
+    assert prefetch_first_matches(few, "div.product", few.css("div.product"), fields) is None
+
+    tree = HTMLParser(f"<body>{PRODUCTS}</body>")
+    assert prefetch_first_matches(tree, "div.product, li", tree.css("div.product, li"), fields) is None
+
+    nested = HTMLParser(f"<body><div class='product'>{PRODUCTS}</div></body>")
+    assert prefetch_first_matches(nested, "div.product", nested.css("div.product"), fields) is None
+
+
+@as_new_section_sync
+def test_compile_fields_threads():
+    # Many schemas compiled at once from several threads, as follow workers do
+    schemas = [[{"name": f"f{i}", "type": "text", "selector": "a"}] for i in range(3000)]
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        compiled = list(pool.map(compile_fields, schemas))
+    assert [fields[0].name for fields in compiled] == [f"f{i}" for i in range(3000)]
+    assert compile_fields(schemas[-1]) is compiled[-1]
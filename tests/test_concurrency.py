@@ -0,0 +1,94 @@
+import asyncio
+import time
+import pytest
+from crawl2schema.crawler.concurrency import AdaptiveLimiter, ConcurrencySettings
+from util import as_new_section_async, as_new_section_sync
+
+
+class Overloaded(Exception):
+    status = 429
+
+
+async def run_requests(limiter: AdaptiveLimiter, count: int, duration: float = 0.01) -> int:
+    """Run `count` requests through `limiter` at once, returning the most that were in flight together."""
+    active = peak = 0
+
+    async def request():
+        nonlocal active, peak
+        async with limiter:
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(duration)
+            active -= 1
+
+    await asyncio.gather(*(request() for _ in range(count)))
+    return peak
+
+
+@as_new_section_sync
+def test_invalid_settings():
+    with pytest.raises(ValueError):
+        AdaptiveLimiter(ConcurrencySettings(min_concurrency=0))
+    with pytest.raises(ValueError):
+        AdaptiveLimiter(ConcurrencySettings(min_concurrency=5, max_concurrency=2))
+    with pytest.raises(ValueError):
+        AdaptiveLimiter(ConcurrencySettings(max_tasks_per_minute=0))
+
+
+@as_new_section_sync
+def test_starts_at_desired_concurrency():
+    assert AdaptiveLimiter(ConcurrencySettings(desired_concurrency=4)).limit == 4
+    # Clamped into [min_concurrency, max_concurrency]
+    assert AdaptiveLimiter(ConcurrencySettings(desired_concurrency=80, max_concurrency=10)).limit == 10
+    assert AdaptiveLimiter(ConcurrencySettings(desired_concurrency=1, min_concurrency=3)).limit == 3
+
+
+@as_new_section_async
+async def test_limits_requests_in_flight():
+    limiter = AdaptiveLimiter(ConcurrencySettings(desired_concurrency=3, max_concurrency=3))
+    assert await run_requests(limiter, 12) == 3
+    assert limiter._active == 0
+
+
+@as_new_section_async
+async def test_grows_after_successful_rounds():
+    limiter = AdaptiveLimiter(ConcurrencySettings(desired_concurrency=1, max_concurrency=3))
+    for _ in range(10):
+        await run_requests(limiter, 1)
+    # One more slot per full round of successes, up to max_concurrency
+    assert limiter.limit == 3
+
+
+@as_new_section_async
+async def test_halves_on_overload():
+    limiter = AdaptiveLimiter(ConcurrencySettings(desired_concurrency=8, min_concurrency=3, max_concurrency=8))
+
+    with pytest.raises(TimeoutError):
+        async with limiter:
+            raise TimeoutError()
+    assert limiter.limit == 4
+
+    # Statuses are found through wrapping exceptions too
+    with pytest.raises(RuntimeError):
+        async with limiter:
+            try:
+                raise Overloaded()
+            except Overloaded as e:
+                raise RuntimeError("fetch failed") from e
+    assert limiter.limit == 3  # not below min_concurrency
+
+    # Other errors leave the limit alone
+    with pytest.raises(KeyError):
+        async with limiter:
+            raise KeyError()
+    assert limiter.limit == 3
+    assert limiter._active == 0
+
+
+@as_new_section_async
+async def test_max_tasks_per_minute():
+    limiter = AdaptiveLimiter(ConcurrencySettings(desired_concurrency=10, max_tasks_per_minute=600))
+    started = time.monotonic()
+    await run_requests(limiter, 3, duration=0)
+    # Starts are spaced 0.1s apart
+    assert time.monotonic() - started >= 0.2
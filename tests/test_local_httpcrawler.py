@@ -0,0 +1,239 @@
+import asyncio
+from urllib3 import HTTPResponse
+from crawl2schema.crawler.http import SyncHTTPCrawler, AsyncHTTPCrawler, pooled_session
+from crawl2schema.crawler.schema import HTTPCrawlerSchema
+from util import as_new_section_sync, serve_pages
+
+
+# Offline counterparts of the live tests, against pages served from this process
+
+ITEMS_PAGE = """
+<html><body>
+  <div class="item"><a href="/product/12">  Widget
+     twelve </a><span class="price">€ 1.50</span></div>
+  <div class="item"><a>Widget without link</a><span class="price">€ 2.00</span></div>
+</body></html>
+"""
+
+
+@as_new_section_sync
+def test_pattern_missing_attribute():
+    field = {"name": "id", "type": "text", "selector": "a", "attribute": "href", "default": None}
+    with_pattern: HTTPCrawlerSchema = {"base_selector": "div.item", "fields": [dict(field, pattern=r"/product/(\d+)")]}
+    without_pattern: HTTPCrawlerSchema = {"base_selector": "div.item", "fields": [field]}
+
+    with serve_pages({"/items": ITEMS_PAGE}) as base:
+        crawler = SyncHTTPCrawler()
+        records = crawler.fetch(f"{base}/items", with_pattern)
+        plain = crawler.fetch(f"{base}/items", without_pattern)
+
+    assert records[0]["id"] == "12"
+    # The missing href keeps its default, as it does without a pattern
+    assert records[1]["id"] == plain[1]["id"]
+    print(records)
+
+
+FOLLOW_PAGES = {
+    "/list": """
+        <div class="item"><h1>one</h1><a href="/detail/1">more</a><p>own title</p></div>
+        <div class="item"><h1>two</h1><a href="/detail/2">more</a></div>
+    """,
+    "/detail/1": "<h2>title 1</h2><span>detail name</span>",
+    "/detail/2": "<h2>title 2</h2>",
+}
+
+
+def follow_schema(base: str) -> HTTPCrawlerSchema:
+    detail: HTTPCrawlerSchema = {
+        "base_selector": "body",
+        "fields": [
+            {"name": "title", "type": "text", "selector": "h2"},
+            {"name": "name", "type": "text", "selector": "span", "default": "no name"},
+        ],
+    }
+    return {
+        "base_selector": "div.item",
+        "fields": [
+            {"name": "name", "type": "text", "selector": "h1"},
+            {"name": "link", "type": "text", "selector": "a", "attribute": "href",
+             "postformatter": lambda href: base + href, "url_follow_schema": detail},
+            {"name": "title", "type": "text", "selector": "p", "default": "no title"},
+        ],
+    }
+
+
+# A follow's keys override the fields before it and are overridden by the fields after it
+EXPECTED_FOLLOWS = [
+    {"name": "detail name", "title": "own title"},
+    {"name": "no name", "title": "no title"},
+]
+
+
+@as_new_section_sync
+def test_follow_merge_order_sync():
+    with serve_pages(FOLLOW_PAGES) as base:
+        records = SyncHTTPCrawler().fetch(f"{base}/list", follow_schema(base))
+    assert records == EXPECTED_FOLLOWS
+    assert [list(record) for record in records] == [["name", "title"]] * 2
+
+
+@as_new_section_sync
+def test_follow_merge_order_async():
+    async def fetch(base):
+        async with AsyncHTTPCrawler() as crawler:
+            return await crawler.fetch(f"{base}/list", follow_schema(base))
+
+    with serve_pages(FOLLOW_PAGES) as base:
+        records = asyncio.run(fetch(base))
+    assert records == EXPECTED_FOLLOWS
+    assert [list(record) for record in records] == [["name", "title"]] * 2
+
+
+def concurrent_follow_hits(first: dict, second: dict) -> int:
+    """Fetch /list twice at once with the given fetch() options, counting the requests for /detail/1."""
+    hits = []
+
+    async def fetch_both(base):
+        async with AsyncHTTPCrawler() as crawler:
+            schema = follow_schema(base)
+            return await asyncio.gather(
+                crawler.fetch(f"{base}/list", schema, **first),
+                crawler.fetch(f"{base}/list", schema, **second),
+            )
+
+    with serve_pages(FOLLOW_PAGES, hits, delay=0.2) as base:
+        first_records, second_records = asyncio.run(fetch_both(base))
+    assert first_records == second_records == EXPECTED_FOLLOWS
+    return hits.count("/detail/1")
+
+
+@as_new_section_sync
+def test_inflight_follows_shared():
+    assert concurrent_follow_hits({"headers": {"X-Test": "a"}}, {"headers": {"X-Test": "a"}}) == 1
+
+
+@as_new_section_sync
+def test_inflight_follows_per_request():
+    # Follows made with other request arguments, or for a fetch bypassing the cache, aren't joined
+    assert concurrent_follow_hits({"headers": {"X-Test": "a"}}, {"headers": {"X-Test": "b"}}) == 2
+    assert concurrent_follow_hits({}, {"cache": False}) == 2
+
+
+PAGED = {
+    f"/products?page={page}": "".join(
+        f'<div class="product"><h3>Product {page}.{i}</h3><span class="price">{page * 10 + i}</span></div>'
+        for i in range(3)
+    )
+    for page in range(1, 5)
+}
+
+
+def paged_schema(end_page: int = 4) -> HTTPCrawlerSchema:
+    return {
+        "base_selector": "div.product",
+        "fields": [
+            {"name": "name", "type": "text", "selector": "h3"},
+            {"name": "price", "type": "number", "selector": "span.price"},
+        ],
+        "url_pagination": {"start_page": 1, "end_page": end_page},
+    }
+
+
+@as_new_section_sync
+def test_layout_columns():
+    schema = paged_schema(2)
+
+    async def fetch(base):
+        async with AsyncHTTPCrawler() as crawler:
+            return await crawler.fetch(f"{base}/products?page={{page}}", schema, layout="columns")
+
+    with serve_pages(PAGED) as base:
+        rows = SyncHTTPCrawler().fetch(f"{base}/products?page={{page}}", schema)
+        sync_columns = SyncHTTPCrawler().fetch(f"{base}/products?page={{page}}", schema, layout="columns")
+        async_columns = asyncio.run(fetch(base))
+
+    expected = {
+        "name": ["Product 1.0", "Product 1.1", "Product 1.2", "Product 2.0", "Product 2.1", "Product 2.2"],
+        "price": [10, 11, 12, 20, 21, 22],
+    }
+    assert sync_columns == async_columns == expected
+    assert [dict(zip(expected, values)) for values in zip(*expected.values())] == rows
+
+
+@as_new_section_sync
+def test_result_cache():
+    hits = []
+    schema = paged_schema(2)
+    with serve_pages(PAGED, hits) as base:
+        crawler = SyncHTTPCrawler(cache_size=8)
+        first = crawler.fetch(f"{base}/products?page={{page}}", schema)
+        assert crawler.fetch(f"{base}/products?page={{page}}", schema) == first
+        assert len(hits) == 2
+
+        crawler.fetch(f"{base}/products?page={{page}}", schema, cache=False)
+        assert len(hits) == 4
+        crawler.clear_cache()
+        crawler.fetch(f"{base}/products?page={{page}}", schema)
+        assert len(hits) == 6
+
+
+
+@as_new_section_sync
+def test_result_cache_per_request():
+    # Fetches of one url with other request arguments are cached apart
+    pages = {"/search?q=a": PAGED["/products?page=1"], "/search?q=b": PAGED["/products?page=2"]}
+    schema = paged_schema()
+    del schema["url_pagination"]
+
+    async def fetch_async(base):
+        async with AsyncHTTPCrawler(cache_size=8) as crawler:
+            return [await crawler.fetch(f"{base}/search", schema, params={"q": q}) for q in "ab"]
+
+    with serve_pages(pages) as base:
+        crawler = SyncHTTPCrawler(cache_size=8)
+        sync_a, sync_b = (crawler.fetch(f"{base}/search", schema, params={"q": q}) for q in "ab")
+        async_a, async_b = asyncio.run(fetch_async(base))
+
+    assert sync_a == async_a and sync_a[0]["name"] == "Product 1.0"
+    assert sync_b == async_b and sync_b[0]["name"] == "Product 2.0"
+
+@as_new_section_sync
+def test_fetch_incremental():
+    schema = paged_schema()
+
+    async def collect(base, url, stop_after=None):
+        records = []
+        async with AsyncHTTPCrawler() as crawler:
+            async for record in crawler.fetch_incremental(url, schema):
+                records.append(record)
+                if len(records) == stop_after:
+                    break
+            full = await crawler.fetch(url, schema)
+        return records, full
+
+    hits = []
+    with serve_pages(PAGED, hits) as base:
+        records, full = asyncio.run(collect(base, f"{base}/products?page={{page}}"))
+        # The same records as fetch(), in page completion order
+        assert sorted(records, key=lambda r: r["price"]) == full
+        assert len(records) == 12
+
+        # A url without the placeholder is downloaded once and its records repeated per page
+        hits.clear()
+        records, full = asyncio.run(collect(base, f"{base}/products?page=1"))
+        assert records == full and len(records) == 12
+        assert records[0] is not records[3]
+        assert hits == ["/products?page=1"] * 2
+
+        records, _ = asyncio.run(collect(base, f"{base}/products?page={{page}}", stop_after=2))
+        assert len(records) == 2
+
+
+@as_new_section_sync
+def test_pooled_session_caps_retry_after():
+    retry = pooled_session().get_adapter("http://127.0.0.1/").max_retries
+    assert retry.get_retry_after(HTTPResponse(headers={"Retry-After": "3600"})) == 10
+    assert retry.get_retry_after(HTTPResponse(headers={"Retry-After": "2"})) == 2
+    assert retry.get_retry_after(HTTPResponse()) is None
+    # Retries are rebuilt with new() on every attempt and must keep the cap
+    assert retry.new(total=1).get_retry_after(HTTPResponse(headers={"Retry-After": "3600"})) == 10
@@ -1,4 +1,10 @@
 import asyncio
+import threading
+import time
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
 
 def as_new_section_async(func):
     def inner():
@@ -7,9 +13,57 @@ def as_new_section_async(func):
         print(f"\n---\tEND\t---")
     return inner
 
+def _chromium_launches():
+    try:
+        from playwright.sync_api import sync_playwright
+        with sync_playwright() as playwright:
+            playwright.chromium.launch().close()
+    except Exception:
+        return False
+    return True
+
+# Browser tests only run where Playwright's Chromium is installed
+chromium = pytest.mark.skipif(not _chromium_launches(), reason="Chromium is not installed")
+
 def as_new_section_sync(func):
     def inner():
         print(f"\n\n---\t{func.__name__}\t---\n")
         func()
         print(f"\n---\tEND\t---")
-    return inner
\ No newline at end of file
+    return inner
+
+
+@contextmanager
+def serve_pages(pages, hits=None, delay=0):
+    """
+    Serve `pages` (path -> HTML) from a local server on a free port, yielding its base URL.
+    Requested paths are appended to `hits` when given; responses wait `delay` seconds.
+    """
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if hits is not None:
+                hits.append(self.path)
+            if delay:
+                time.sleep(delay)
+            html = pages.get(self.path)
+            if html is None:
+                self.send_error(404)
+                return
+            body = html.encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "text/html; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_port}"
+    finally:
+        server.shutdown()
+        server.server_close()